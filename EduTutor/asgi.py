@@ -8,6 +8,12 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from EduTutor.warmup import warm_url_resolvers
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'EduTutor.settings')
 
 application = get_asgi_application()
+
+# Build the URL resolvers' lookup tables at startup instead of on the first
+# request (only server processes load this module, not management commands)
+warm_url_resolvers()
@@ -8,6 +8,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 import environ
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -147,10 +148,40 @@ DATABASES = {
         'PASSWORD': env.str('DATABASE_PASSWORD', default=''),
         'HOST': env.str('DATABASE_HOST', default=''),
         'PORT': env.str('DATABASE_PORT', default=''),
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': env.int('DATABASE_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+# Default: local-memory cache for development
+# For production, use Redis (django.core.cache.backends.redis.RedisCache)
+
+CACHES = {
+    'default': {
+        'BACKEND': env.str('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': env.str('CACHE_LOCATION', default=''),
+    }
+}
+
+# The response caches (course and quiz lists, latest policy documents,
+# unknown-email lookups, course ETags) are invalidated by deleting or
+# versioning keys, which only reaches every worker on a shared backend.
+# They are left off on per-process backends such as LocMemCache.
+SHARED_CACHE = env.bool(
+    'SHARED_CACHE',
+    default=CACHES['default']['BACKEND'] not in (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.dummy.DummyCache',
+    ),
+)
+
+
 # =============================================================================
 # PASSWORD VALIDATION
 # =============================================================================
@@ -234,6 +265,7 @@ REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
         'user': '1000/hour',
+        'login': '10/minute',
     },
     'EXCEPTION_HANDLER': 'core_auth.exceptions.custom_exception_handler',
 }
@@ -389,14 +421,22 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60  # 25 minutes
 
+# Email tasks get their own queue so slow SMTP can't hold up other work;
+# workers must consume it too (-Q celery,email_queue)
+CELERY_TASK_ROUTES = {
+    'core_auth.tasks.send_*': {'queue': 'email_queue'},
+}
+
 # Celery beat schedule (for periodic tasks)
 CELERY_BEAT_SCHEDULE = {
-    # Add periodic tasks here if needed
-    # Example:
-    # 'clean-up-old-otps': {
-    #     'task': 'core_auth.tasks.cleanup_expired_otps',
-    #     'schedule': crontab(hour=2, minute=0),  # Run daily at 2 AM
-    # },
+    'clean-up-old-tokens': {
+        'task': 'core_auth.tasks.cleanup_expired_tokens',
+        'schedule': crontab(hour=2, minute=0),  # Run daily at 2 AM
+    },
+    'flush-expired-refresh-tokens': {
+        'task': 'core_auth.tasks.flush_expired_refresh_tokens',
+        'schedule': crontab(hour=2, minute=30),  # Run daily at 2:30 AM
+    },
 }
 
 
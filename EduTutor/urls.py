@@ -5,6 +5,8 @@ from django.contrib import admin
 from django.urls import include, path
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -21,7 +23,12 @@ urlpatterns = [
     path('api/v1/parent/', include('ParentDashboard.urls', namespace='parent_dashboard')),
     
     # API Documentation URLs
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    # The schema only changes on deploy; vary on Accept since it is served as YAML or JSON
+    path(
+        'api/schema/',
+        cache_page(60 * 60, key_prefix='schema')(vary_on_headers('Accept')(SpectacularAPIView.as_view())),
+        name='schema',
+    ),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     path('', SpectacularSwaggerView.as_view(url_name='schema'), name='api-docs'),  # Root redirects to Swagger
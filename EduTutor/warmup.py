@@ -0,0 +1,16 @@
+"""
+Startup warm-up for EduTutor server processes.
+"""
+
+from django.urls import get_resolver
+
+
+def warm_url_resolvers():
+    """
+    Build the URL resolvers' reverse lookup tables now instead of on the
+    first request. Returns the number of lookup keys populated.
+    """
+    root = get_resolver()
+    resolvers = [root] + [resolver for _, resolver in root.namespace_dict.values()]
+    # reverse_dict is populated lazily on first access
+    return sum(len(resolver.reverse_dict) for resolver in resolvers)
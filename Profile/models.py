@@ -26,9 +26,14 @@ class StudentProfile(models.Model):
     def save(self, *args, **kwargs):
         """Override save method to auto-generate student_id if not provided."""
         if not self.student_id:
-            self.student_id = f"STU-{self.user.id:06d}"
+            self.student_id = self.id_for_user(self.user)
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def id_for_user(user):
+        """Return the student_id derived from the user's primary key."""
+        return f"STU-{user.id:06d}"
+
 
 class TeacherProfile(models.Model):
     teacher_id=models.CharField(("Teacher ID"), max_length=50, primary_key=True)
@@ -56,9 +61,14 @@ class TeacherProfile(models.Model):
     def save(self, *args, **kwargs):
         """Override save method to auto-generate teacher_id if not provided."""
         if not self.teacher_id:
-            self.teacher_id = f"TEA-{self.user.id:06d}"
+            self.teacher_id = self.id_for_user(self.user)
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def id_for_user(user):
+        """Return the teacher_id derived from the user's primary key."""
+        return f"TEA-{user.id:06d}"
+
 
 class ParentProfile(models.Model):
     parent_id=models.CharField(max_length=50, blank=False, primary_key=True)
@@ -85,9 +95,14 @@ class ParentProfile(models.Model):
     def save(self, *args, **kwargs):
         """Override save method to auto-generate parent_id if not provided."""
         if not self.parent_id:
-            self.parent_id = f"PAR-{self.user.id:06d}"
+            self.parent_id = self.id_for_user(self.user)
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def id_for_user(user):
+        """Return the parent_id derived from the user's primary key."""
+        return f"PAR-{user.id:06d}"
+
 
 
 class ParentPreference(models.Model):
@@ -130,5 +145,10 @@ class AdminProfile(models.Model):
     def save(self, *args, **kwargs):
         """Override save method to auto-generate admin_id if not provided."""
         if not self.admin_id:
-            self.admin_id = f"ADM-{self.user.id:06d}"
-        super().save(*args, **kwargs)
\ No newline at end of file
+            self.admin_id = self.id_for_user(self.user)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def id_for_user(user):
+        """Return the admin_id derived from the user's primary key."""
+        return f"ADM-{user.id:06d}"
\ No newline at end of file
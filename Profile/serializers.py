@@ -4,6 +4,8 @@ Serializers for the Profile app.
 This module contains serializers for user profile management.
 """
 
+import re
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
@@ -11,6 +13,9 @@ from .models import AdminProfile
 
 User = get_user_model()
 
+# Optional leading plus, then digits separated by spaces or dashes
+_PHONE_RE = re.compile(r"\+?[ \-]*[0-9][0-9 \-]*")
+
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -51,31 +56,20 @@ class UserSerializer(serializers.ModelSerializer):
         return obj.full_name
 
 
-class ProfileUpdateSerializer(serializers.ModelSerializer):
+class ProfileUpdateSerializer(UserSerializer):
     """
     Serializer for updating user profile.
 
-    Only allows updating non-sensitive profile fields.
+    Only allows updating non-sensitive profile fields; renders the same
+    representation as UserSerializer, so the view can return its data.
     """
 
-    class Meta:
-        model = User
-        fields = [
-            "first_name",
-            "last_name",
-            "phone_number",
-            "role",
-        ]
-
     def validate_phone_number(self, value):
         """Validate phone number format."""
-        if value:
-            # Remove spaces and dashes
-            cleaned = value.replace(" ", "").replace("-", "")
-            if not cleaned.replace("+", "").isdigit():
-                raise serializers.ValidationError(
-                    "Phone number must contain only digits, spaces, dashes, or a leading plus sign."
-                )
+        if value and not _PHONE_RE.fullmatch(value):
+            raise serializers.ValidationError(
+                "Phone number must contain only digits, spaces, dashes, or a leading plus sign."
+            )
         return value
 
 
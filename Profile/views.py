@@ -5,6 +5,7 @@ This module contains all API views for user profile management.
 """
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -25,6 +26,12 @@ from .models import AdminProfile
 
 User = get_user_model()
 
+# Columns UserSerializer renders (full_name is derived from them); they
+# include everything email verification and its receivers read
+_VERIFY_EMAIL_USER_FIELDS = [
+    field for field in UserSerializer.Meta.fields if field != "full_name"
+]
+
 
 class ProfileView(generics.RetrieveAPIView):
     """
@@ -96,7 +103,7 @@ class ProfileUpdateView(generics.UpdateAPIView):
         return Response(
             {
                 "message": "Profile updated successfully.",
-                "user": UserSerializer(instance).data,
+                "user": serializer.data,
             }
         )
 
@@ -239,23 +246,28 @@ class EmailVerificationConfirmView(APIView):
         serializer = EmailVerificationSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Get user by email
-        try:
-            user = User.objects.get(email=serializer.validated_data["email"])
-        except User.DoesNotExist:
+        # Get user by email, without the columns nothing here reads
+        user = (
+            User.objects.only(*_VERIFY_EMAIL_USER_FIELDS)
+            .filter(email=serializer.validated_data["email"].lower())
+            .first()
+        )
+        if user is None:
             return Response(
                 {"error": "Invalid email or OTP."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Verify the OTP
-        success = EmailVerificationService.verify_email(
-            user, serializer.validated_data["otp"]
-        )
+        # Consuming the OTP, marking the user verified (which creates their
+        # role profile) and recording the refresh token commit together, so
+        # a failure part way never leaves the OTP spent without tokens
+        with transaction.atomic():
+            success = EmailVerificationService.verify_email(
+                user, serializer.validated_data["otp"]
+            )
+            if success:
+                tokens = TokenService.get_tokens_for_user(user)
 
         if success:
-            # Generate tokens for the verified user
-            tokens = TokenService.get_tokens_for_user(user)
-            
             return Response(
                 {
                     "message": "Email verified successfully.",
@@ -0,0 +1,111 @@
+"""
+Custom serializer fields for the academics app.
+
+This module provides relational fields that validate submitted
+primary keys in bulk instead of one query per key.
+"""
+
+from rest_framework import serializers
+from rest_framework.fields import get_attribute
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """
+    Many-related field that resolves all submitted primary keys at once.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        return self.child_relation.to_internal_value_bulk(data)
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that, with many=True, checks every submitted id
+    with a single `pk__in` query.
+
+    Errors are raised for the first offending id in submission order, with
+    the same messages as PrimaryKeyRelatedField.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+    def to_internal_value_bulk(self, data):
+        """
+        Resolve a list of primary keys to model instances, preserving order.
+        """
+        queryset = self.get_queryset()
+        pk_field = queryset.model._meta.pk
+
+        pks = []
+        for item in data:
+            if self.pk_field is not None:
+                item = self.pk_field.to_internal_value(item)
+            try:
+                if isinstance(item, bool):
+                    raise TypeError
+                pks.append((item, pk_field.get_prep_value(item)))
+            except (TypeError, ValueError):
+                self.fail('incorrect_type', data_type=type(item).__name__)
+
+        found = queryset.in_bulk({pk for _, pk in pks})
+
+        instances = []
+        for item, pk in pks:
+            if pk not in found:
+                self.fail('does_not_exist', pk_value=item)
+            instances.append(found[pk])
+        return instances
+
+
+class AnnotatedCountField(serializers.IntegerField):
+    """
+    Read-only count taken from a queryset annotation (`source`).
+
+    Instances that were not loaded through an annotated queryset (e.g. a
+    freshly created object) fall back to counting `relation`.
+    """
+
+    def __init__(self, relation, **kwargs):
+        self.relation = relation
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        try:
+            return get_attribute(instance, self.source_attrs)
+        except (AttributeError, KeyError):
+            return getattr(instance, self.relation).count()
+
+
+class ValuesRowListSerializer(serializers.ListSerializer):
+    """
+    many=True serializer for plain Serializers rendered from .values() rows.
+
+    Resolves the child's readable fields once per list instead of once per
+    row. Every field's source must be a single key of the row.
+    """
+
+    def to_representation(self, data):
+        fields = [
+            (field.field_name, field.source, field.to_representation)
+            for field in self.child._readable_fields
+        ]
+        return [
+            {
+                name: None if row[source] is None else to_representation(row[source])
+                for name, source, to_representation in fields
+            }
+            for row in data
+        ]
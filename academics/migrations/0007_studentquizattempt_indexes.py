@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-15 22:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academics", "0006_studentquizattempt"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="studentquizattempt",
+            index=models.Index(
+                fields=["student", "quiz", "-attempted_at"],
+                name="academics_s_student_23d811_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentquizattempt",
+            index=models.Index(
+                fields=["quiz", "score"], name="academics_s_quiz_id_dd7572_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-15 22:46
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_total_points(apps, schema_editor):
+    Quiz = apps.get_model("academics", "Quiz")
+    question_points = (
+        Quiz.questions.through.objects.filter(quiz=OuterRef("pk"))
+        .values("quiz")
+        .annotate(total=Sum("quizquestion__question_point"))
+        .values("total")
+    )
+    Quiz.objects.update(total_points=Coalesce(Subquery(question_points), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academics", "0007_studentquizattempt_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="total_points",
+            field=models.IntegerField(
+                default=0,
+                editable=False,
+                help_text="Sum of question points, kept in sync with questions",
+            ),
+        ),
+        migrations.RunPython(backfill_total_points, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-15 22:52
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_question_count(apps, schema_editor):
+    Quiz = apps.get_model("academics", "Quiz")
+    question_count = (
+        Quiz.questions.through.objects.filter(quiz=OuterRef("pk"))
+        .values("quiz")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Quiz.objects.update(question_count=Coalesce(Subquery(question_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academics", "0008_quiz_total_points"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="quiz",
+            name="question_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of questions, kept in sync with questions",
+            ),
+        ),
+        migrations.RunPython(backfill_question_count, migrations.RunPython.noop),
+    ]
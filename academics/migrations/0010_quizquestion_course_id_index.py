@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academics", "0009_quiz_question_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quizquestion",
+            index=models.Index(
+                fields=["course", "-id"], name="academics_q_course__c20aeb_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-15 23:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academics", "0010_quizquestion_course_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="studentquizattempt",
+            index=models.Index(
+                fields=["student", "-attempted_at"],
+                name="academics_s_student_cbf453_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,193 @@
+"""
+View mixins for the academics app.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import permissions, serializers, status
+from rest_framework.response import Response
+
+from .utils import list_cache_version
+
+
+# (serializer class, model) -> (select_related paths, prefetch_related paths, only() columns or None)
+_related_paths_cache = {}
+
+
+def _collect_related_paths(serializer, model, prefix, to_many, plan):
+    """
+    Walk a serializer's readable fields and record the relations they
+    traverse and, outside to-many relations, the columns they read.
+    """
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == '*':
+            # SerializerMethodField and the like get the whole object
+            if not to_many:
+                plan['columns'] = None
+            continue
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        is_nested = isinstance(nested, serializers.BaseSerializer)
+
+        # A plain PK field only reads the local `<fk>_id` column
+        attrs = field.source.split('.')
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            attrs = attrs[:-1]
+
+        path, current, many, column = [], model, to_many, None
+        for attr in attrs:
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Property, method or annotation: can't tell which columns it needs
+                if not many:
+                    plan['columns'] = None
+                break
+            if not model_field.is_relation:
+                column = path + [attr]
+                break
+            path.append(attr)
+            many = many or model_field.many_to_many or model_field.one_to_many
+            current = model_field.related_model
+        else:
+            if is_nested and path:
+                _collect_related_paths(
+                    nested, current, prefix + '__'.join(path) + '__', many, plan
+                )
+            elif isinstance(field, serializers.PrimaryKeyRelatedField):
+                column = path + field.source.split('.')[-1:]
+
+        if path:
+            plan['prefetch' if many else 'select'].add(prefix + '__'.join(path))
+        if column and not many and plan['columns'] is not None:
+            plan['columns'].add(prefix + '__'.join(column))
+
+
+def auto_prefetch(serializer_class, queryset, only=False):
+    """
+    Add the select_related/prefetch_related calls needed to render
+    `serializer_class` from `queryset`, and with `only=True` restrict the
+    loaded columns to the ones it reads (skipped if any field's source is
+    not a model field). Introspection runs once per (serializer class,
+    model); .values() querysets are returned as-is.
+    """
+    if queryset._fields is not None:
+        return queryset
+
+    key = (serializer_class, queryset.model)
+    if key not in _related_paths_cache:
+        plan = {'select': set(), 'prefetch': set(), 'columns': set()}
+        _collect_related_paths(serializer_class(), queryset.model, '', False, plan)
+        columns = sorted(plan['columns']) if plan['columns'] is not None else None
+        _related_paths_cache[key] = (sorted(plan['select']), sorted(plan['prefetch']), columns)
+
+    select, prefetch, columns = _related_paths_cache[key]
+    # Leave lookups the view already set up (e.g. Prefetch objects) alone
+    seen = {getattr(lookup, 'prefetch_to', lookup) for lookup in queryset._prefetch_related_lookups}
+    prefetch = [path for path in prefetch if path not in seen]
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if only and columns:
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+class AutoPrefetchMixin:
+    """
+    Generic-view mixin that eager-loads the relations the serializer reads.
+
+    Hooks filter_queryset() so it also applies to views that override
+    get_queryset(), and to get_object(). Columns are narrowed with only()
+    for safe methods; writes keep full rows so save() doesn't skip fields.
+    """
+
+    def filter_queryset(self, queryset):
+        return auto_prefetch(
+            self.get_serializer_class(),
+            super().filter_queryset(queryset),
+            only=self.request.method in permissions.SAFE_METHODS,
+        )
+
+
+class CheapMethodMixin:
+    """
+    List-view mixin that answers OPTIONS from anonymous clients (API
+    explorers) without building the queryset. HEAD still goes through get,
+    so conditional-GET headers and 304s apply to it as well.
+
+    Permissions have already run by the time a handler is called, and for
+    anonymous users the OPTIONS metadata of a view never changes, so it is
+    computed once per view class. Authenticated requests take the normal path.
+    """
+
+    _anonymous_metadata = None
+
+    def options(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().options(request, *args, **kwargs)
+        cls = type(self)
+        if cls.__dict__.get('_anonymous_metadata') is None:
+            cls._anonymous_metadata = self.metadata_class().determine_metadata(request, self)
+        return Response(cls._anonymous_metadata, status=status.HTTP_200_OK)
+
+
+class VersionedListCacheMixin:
+    """
+    List-view mixin that caches serialized pages under a versioned key.
+
+    Receivers in models.py bump the namespace version whenever the rows
+    behind the list change, so stale pages are never served; they simply
+    expire. Only the serialized data is cached, so content negotiation and
+    rendering still run per request. Off unless settings.SHARED_CACHE.
+    """
+
+    list_cache_namespace = None
+    list_cache_timeout = 300
+
+    def list(self, request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return super().list(request, *args, **kwargs)
+        url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        key = (
+            f"academics:{self.list_cache_namespace}:"
+            f"v{list_cache_version(self.list_cache_namespace)}:{url_hash}"
+        )
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, self.list_cache_timeout)
+        return Response(data)
+
+
+class VersionedDetailCacheMixin:
+    """
+    Retrieve-view mixin that caches the serialized object under a versioned
+    key, invalidated the same way as VersionedListCacheMixin.
+
+    A cache hit skips get_object(), so only use it on views without
+    object-level permissions. Off unless settings.SHARED_CACHE.
+    """
+
+    detail_cache_namespace = None
+    detail_cache_timeout = 3600
+
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return super().retrieve(request, *args, **kwargs)
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        key = (
+            f"academics:{self.detail_cache_namespace}:"
+            f"v{list_cache_version(self.detail_cache_namespace)}:{lookup}"
+        )
+        data = cache.get(key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            cache.set(key, data, self.detail_cache_timeout)
+        return Response(data)
@@ -1,4 +1,14 @@
-from django.db import models
+from bisect import bisect_right
+from functools import partial
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .utils import bump_list_cache_version
 
 class Skills(models.Model):
     name = models.CharField(max_length=100)
@@ -84,6 +94,11 @@ class QuizQuestion(models.Model):
     correct_option = models.CharField(max_length=1, choices=options)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['course', '-id']),
+        ]
+
     def __str__(self):
         return f"Question for {self.course.name}"
     
@@ -94,13 +109,42 @@ class Quiz(models.Model):
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='quizzes')
     questions = models.ManyToManyField(QuizQuestion, related_name='quizzes')
     passing_score = models.IntegerField(help_text="Minimum score required to pass the quiz", default=70)
+    total_points = models.IntegerField(default=0, editable=False, help_text="Sum of question points, kept in sync with questions")
+    question_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of questions, kept in sync with questions")
     created_by=models.ForeignKey('core_auth.User', on_delete=models.SET_NULL, null=True, related_name='created_quizzes')
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Quiz: {self.name} for {self.course.name}"
+
+    @classmethod
+    def sync_question_totals(cls, quiz_ids):
+        """Recompute the stored total_points and question_count of the given quizzes in one UPDATE."""
+        quiz_questions = (
+            cls.questions.through.objects
+            .filter(quiz=OuterRef('pk'))
+            .values('quiz')
+        )
+        cls.objects.filter(pk__in=quiz_ids).update(
+            total_points=Coalesce(
+                Subquery(quiz_questions.annotate(total=Sum('quizquestion__question_point')).values('total')), 0
+            ),
+            question_count=Coalesce(
+                Subquery(quiz_questions.annotate(total=Count('pk')).values('total')), 0
+            ),
+        )
     
 
+# Lowest percentage for each grade above F, ascending.
+GRADE_THRESHOLDS = (60, 63, 67, 70, 73, 77, 80, 83, 87, 90, 93, 97)
+GRADE_LABELS = ('F', 'D-', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+
+
+def compute_grade(percentage):
+    """Map a progress percentage to its letter grade."""
+    return GRADE_LABELS[bisect_right(GRADE_THRESHOLDS, percentage)]
+
+
 class StudentQuizAttempt(models.Model):
 
     student = models.ForeignKey('core_auth.User', on_delete=models.CASCADE, related_name='quiz_attempts')
@@ -110,43 +154,147 @@ class StudentQuizAttempt(models.Model):
     progress_percentage = models.FloatField()
     attempted_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'quiz', '-attempted_at']),
+            models.Index(fields=['student', '-attempted_at']),
+            models.Index(fields=['quiz', 'score']),
+        ]
+
     def __str__(self):
         return f"{self.student.email} - {self.quiz.name} Attempted at {self.attempted_at}"
     
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was loaded so save() can tell whether the score changed
+        instance._loaded_score = instance.__dict__.get('score')
+        instance._loaded_quiz_id = instance.__dict__.get('quiz_id')
+        return instance
+
     def save(self, *args, **kwargs):
         """Override save method to calculate pass/fail and progress percentage."""
-        total_points = sum(q.question_point for q in self.quiz.questions.all())
-        self.progress_percentage = (self.score / total_points) * 100 if total_points > 0 else 0
-        self.grade = self.calculate_grade()
+        if (
+            self._state.adding
+            or self.progress_percentage is None
+            or self.score != getattr(self, '_loaded_score', None)
+            or self.quiz_id != getattr(self, '_loaded_quiz_id', None)
+        ):
+            total_points = self.quiz.total_points
+            self.progress_percentage = (self.score / total_points) * 100 if total_points > 0 else 0
+            self.grade = self.calculate_grade()
 
         super().save(*args, **kwargs)
+        self._loaded_score = self.score
+        self._loaded_quiz_id = self.quiz_id
 
     def calculate_grade(self):
-        percentage = self.progress_percentage
-        if percentage >= 97:
-            return 'A+'
-        elif percentage >= 93:
-            return 'A'
-        elif percentage >= 90:
-            return 'A-'
-        elif percentage >= 87:
-            return 'B+'
-        elif percentage >= 83:
-            return 'B'
-        elif percentage >= 80:
-            return 'B-'
-        elif percentage >= 77:
-            return 'C+'
-        elif percentage >= 73:
-            return 'C'
-        elif percentage >= 70:
-            return 'C-'
-        elif percentage >= 67:
-            return 'D+'
-        elif percentage >= 63:
-            return 'D'
-        elif percentage >= 60:
-            return 'D-'
-        else:
-            return 'F'
\ No newline at end of file
+        return compute_grade(self.progress_percentage)
+
+
+@receiver(m2m_changed, sender=Quiz.questions.through)
+def _sync_quiz_totals_on_questions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep Quiz.total_points and question_count in sync when questions are added to or removed from a quiz.
+    """
+    if reverse:
+        # instance is a QuizQuestion; pk_set holds quiz ids
+        if action == 'pre_clear':
+            instance._cleared_quiz_ids = list(instance.quizzes.values_list('pk', flat=True))
+        elif action == 'post_clear':
+            Quiz.sync_question_totals(instance.__dict__.pop('_cleared_quiz_ids', []))
+        elif action in ('post_add', 'post_remove') and pk_set:
+            Quiz.sync_question_totals(pk_set)
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        Quiz.sync_question_totals([instance.pk])
+        instance.refresh_from_db(fields=['total_points', 'question_count'])
+
+
+@receiver(post_save, sender=QuizQuestion)
+def _sync_quiz_totals_on_question_saved(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Recompute total_points of the quizzes using a question when its points may have changed.
+    """
+    if created or (update_fields is not None and 'question_point' not in update_fields):
+        return
+    Quiz.sync_question_totals(instance.quizzes.values('pk'))
+
+
+@receiver(pre_delete, sender=QuizQuestion)
+def _capture_question_quiz_ids(sender, instance, **kwargs):
+    """
+    Remember which quizzes use a question before its m2m rows are cascaded away.
+    """
+    instance._deleted_quiz_ids = list(instance.quizzes.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=QuizQuestion)
+def _sync_quiz_totals_on_question_deleted(sender, instance, **kwargs):
+    """
+    Recompute the totals of the quizzes a deleted question belonged to.
+    """
+    quiz_ids = instance.__dict__.pop('_deleted_quiz_ids', [])
+    if quiz_ids:
+        Quiz.sync_question_totals(quiz_ids)
+
+
+# Cached namespaces (see VersionedListCacheMixin and VersionedDetailCacheMixin)
+# affected by writes to each sender. The 'courses' version also goes into the
+# course ETags, so it covers everything the course detail nests.
+_LIST_CACHE_DEPENDENCIES = {
+    Course: ('courses', 'classes', 'quiz_questions', 'quiz_detail'),
+    Units: ('courses',),
+    Lesson: ('courses',),
+    Skills: ('courses',),
+    Class: ('classes', 'quiz_detail'),
+    QuizQuestion: ('quiz_questions', 'quiz_detail'),
+    Quiz: ('quiz_detail',),
+    Course.units.through: ('courses',),
+    Units.lessons.through: ('courses',),
+    Lesson.skills.through: ('courses',),
+    Class.course.through: ('classes',),
+    Quiz.questions.through: ('quiz_detail',),
+}
+
+
+def _bump_list_caches(sender, action=None, **kwargs):
+    """
+    Invalidate the cached list pages that render rows of `sender`.
+
+    The bump waits for the commit: done earlier, a concurrent read could
+    cache the old rows under the new version.
+    """
+    if action is not None and not action.startswith('post_'):
+        return
+    for namespace in _LIST_CACHE_DEPENDENCIES[sender]:
+        transaction.on_commit(partial(bump_list_cache_version, namespace))
+
+
+for _sender in (Course, Units, Lesson, Skills, Class, QuizQuestion, Quiz):
+    post_save.connect(_bump_list_caches, sender=_sender)
+    post_delete.connect(_bump_list_caches, sender=_sender)
+for _sender in (
+    Course.units.through, Units.lessons.through, Lesson.skills.through,
+    Class.course.through, Quiz.questions.through,
+):
+    m2m_changed.connect(_bump_list_caches, sender=_sender)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def _bump_quiz_detail_on_user_saved(sender, created, update_fields=None, **kwargs):
+    """
+    Quiz details show the creator's name; skip saves that can't change it
+    (new users, last_login updates).
+    """
+    if created:
+        return
+    if update_fields is not None and not {'first_name', 'last_name', 'email'} & set(update_fields):
+        return
+    transaction.on_commit(partial(bump_list_cache_version, 'quiz_detail'))
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _bump_quiz_detail_on_user_deleted(sender, **kwargs):
+    """Deleting a user nulls created_by on their quizzes without a Quiz save."""
+    transaction.on_commit(partial(bump_list_cache_version, 'quiz_detail'))
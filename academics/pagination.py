@@ -0,0 +1,17 @@
+"""
+Pagination classes for the academics app.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key, newest first.
+
+    Avoids the COUNT(*) and OFFSET scan of page-number pagination, so each
+    page costs the same however large the table gets.
+    """
+
+    ordering = '-id'
+    page_size = 50
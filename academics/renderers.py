@@ -0,0 +1,35 @@
+"""
+Renderers for the academics app.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson, for large list payloads.
+
+    orjson writes bytes directly and handles str/int/float/list/dict,
+    datetimes and UUIDs natively; anything else (Decimal, lazy
+    translation strings, querysets...) goes through DRF's JSONEncoder
+    so the output matches JSONRenderer's.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data, default=_fallback_encoder.default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+LIST_RENDERER_CLASSES = [ORJSONRenderer, BrowsableAPIRenderer]
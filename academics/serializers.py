@@ -4,11 +4,26 @@ Serializers for the academics app.
 
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import prefetch_related_objects
+from .fields import (
+    AnnotatedCountField,
+    BulkPrimaryKeyRelatedField,
+    ValuesRowListSerializer,
+)
 from .models import Skills, Lesson, Units, Course, UploadCourseDocuments, Class, QuizQuestion, Quiz, StudentQuizAttempt
 
 User = get_user_model()
 
 
+def first_question_outside_course(questions, course_id):
+    """
+    Return the first question that does not belong to `course_id`, or None.
+
+    Compares the already-loaded course_id, so it issues no queries.
+    """
+    return next((q for q in questions if q.course_id != course_id), None)
+
+
 class SkillsSerializer(serializers.ModelSerializer):
     """
     Serializer for Skills model.
@@ -26,7 +41,7 @@ class LessonSerializer(serializers.ModelSerializer):
     """
 
     skills = SkillsSerializer(many=True, read_only=True)
-    skill_ids = serializers.PrimaryKeyRelatedField(
+    skill_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=Skills.objects.all(),
         write_only=True,
@@ -54,7 +69,7 @@ class UnitsSerializer(serializers.ModelSerializer):
     """
 
     lessons = LessonSerializer(many=True, read_only=True)
-    lesson_ids = serializers.PrimaryKeyRelatedField(
+    lesson_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=Lesson.objects.all(),
         write_only=True,
@@ -81,7 +96,7 @@ class CourseSerializer(serializers.ModelSerializer):
     """
 
     units = UnitsSerializer(many=True, read_only=True)
-    unit_ids = serializers.PrimaryKeyRelatedField(
+    unit_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=Units.objects.all(),
         write_only=True,
@@ -102,28 +117,20 @@ class CourseSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(serializers.Serializer):
     """
-    Simplified serializer for Course listing.
-    """
-
-    units_count = serializers.SerializerMethodField()
+    Simplified, read-only serializer for Course listing.
 
-    class Meta:
-        model = Course
-        fields = [
-            'id',
-            'name',
-            'description',
-            'units_count',
-            'created_at',
-            'updated_at'
-        ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+    Plain Serializer so the list view can render rows straight from a
+    .values() queryset; it also accepts Course instances.
+    """
 
-    def get_units_count(self, obj):
-        """Get the total number of units in this course."""
-        return obj.units.count()
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True, allow_null=True)
+    units_count = AnnotatedCountField(source='_units_count', relation='units')
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
 
 
 class UploadCourseDocumentsSerializer(serializers.ModelSerializer):
@@ -170,7 +177,7 @@ class ClassSerializer(serializers.ModelSerializer):
     """
 
     course = CourseListSerializer(many=True, read_only=True)
-    course_ids = serializers.PrimaryKeyRelatedField(
+    course_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=Course.objects.all(),
         write_only=True,
@@ -191,28 +198,17 @@ class ClassSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class ClassListSerializer(serializers.ModelSerializer):
+class ClassListSerializer(serializers.Serializer):
     """
-    Simplified serializer for Class listing.
+    Simplified, read-only serializer for Class listing (rendered from .values() rows).
     """
 
-    course_count = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Class
-        fields = [
-            'id',
-            'name',
-            'learning_objectives',
-            'course_count',
-            'created_at',
-            'updated_at'
-        ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def get_course_count(self, obj):
-        """Get the total number of courses in this class."""
-        return obj.course.count()
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    learning_objectives = serializers.CharField(read_only=True, allow_null=True)
+    course_count = AnnotatedCountField(source='_course_count', relation='course')
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
 
 
 class QuizQuestionSerializer(serializers.ModelSerializer):
@@ -243,20 +239,27 @@ class QuizQuestionSerializer(serializers.ModelSerializer):
 class QuizQuestionCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating quiz questions.
+    Its output has the same shape as QuizQuestionSerializer.
     """
+
+    course_name = serializers.CharField(source='course.name', read_only=True)
     
     class Meta:
         model = QuizQuestion
         fields = [
+            'id',
             'question_point',
             'question_text',
             'course',
+            'course_name',
             'option_a',
             'option_b',
             'option_c',
             'option_d',
             'correct_option',
+            'created_at',
         ]
+        read_only_fields = ['id', 'created_at']
 
     def validate_correct_option(self, value):
         """Validate that correct_option is one of the valid choices."""
@@ -289,6 +292,21 @@ class QuizQuestionListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id']
 
+    def to_representation(self, instance):
+        # Straight-line equivalent of the generic per-field loop; every field
+        # is a plain column (or course.name) that needs no conversion.
+        # Keep in step with Meta.fields.
+        return {
+            'id': instance.id,
+            'question_point': instance.question_point,
+            'question_text': instance.question_text,
+            'course_name': instance.course.name,
+            'option_a': instance.option_a,
+            'option_b': instance.option_b,
+            'option_c': instance.option_c,
+            'option_d': instance.option_d,
+        }
+
 
 class QuizSerializer(serializers.ModelSerializer):
     """
@@ -296,7 +314,7 @@ class QuizSerializer(serializers.ModelSerializer):
     """
 
     questions = QuizQuestionSerializer(many=True, read_only=True)
-    question_ids = serializers.PrimaryKeyRelatedField(
+    question_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=QuizQuestion.objects.all(),
         write_only=True,
@@ -305,8 +323,8 @@ class QuizSerializer(serializers.ModelSerializer):
     course_name = serializers.CharField(source='course.name', read_only=True)
     class_name_display = serializers.CharField(source='class_name.name', read_only=True)
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
-    total_points = serializers.SerializerMethodField()
-    question_count = serializers.SerializerMethodField()
+    total_points = serializers.IntegerField(read_only=True)
+    question_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Quiz
@@ -328,13 +346,14 @@ class QuizSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at']
 
-    def get_total_points(self, obj):
-        """Calculate total points for the quiz."""
-        return sum(q.question_point for q in obj.questions.all())
 
-    def get_question_count(self, obj):
-        """Get the total number of questions in the quiz."""
-        return obj.questions.count()
+def saved_quiz_representation(quiz, context):
+    """
+    QuizSerializer output for a just-saved quiz, loading its relations in
+    one batch (FKs that are already cached are not fetched again).
+    """
+    prefetch_related_objects([quiz], 'course', 'class_name', 'created_by', 'questions__course')
+    return QuizSerializer(quiz, context=context).data
 
 
 class QuizCreateSerializer(serializers.ModelSerializer):
@@ -342,7 +361,7 @@ class QuizCreateSerializer(serializers.ModelSerializer):
     Serializer for creating quizzes.
     """
 
-    question_ids = serializers.PrimaryKeyRelatedField(
+    question_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=QuizQuestion.objects.all(),
         write_only=True,
@@ -365,12 +384,12 @@ class QuizCreateSerializer(serializers.ModelSerializer):
         # Validate that all questions belong to the same course as the quiz
         if 'questions' in attrs:
             course = attrs.get('course')
-            for question in attrs['questions']:
-                if question.course != course:
-                    raise serializers.ValidationError(
-                        f"Question '{question.question_text[:50]}...' belongs to course '{question.course.name}', "
-                        f"but quiz is for course '{course.name}'"
-                    )
+            question = first_question_outside_course(attrs['questions'], course.pk)
+            if question is not None:
+                raise serializers.ValidationError(
+                    f"Question '{question.question_text[:50]}...' belongs to course '{question.course.name}', "
+                    f"but quiz is for course '{course.name}'"
+                )
         
         # Validate passing score
         passing_score = attrs.get('passing_score', 70)
@@ -395,38 +414,29 @@ class QuizCreateSerializer(serializers.ModelSerializer):
         
         return quiz
 
+    def to_representation(self, instance):
+        """Render the saved quiz in QuizSerializer's shape."""
+        return saved_quiz_representation(instance, self.context)
 
-class QuizListSerializer(serializers.ModelSerializer):
+
+class QuizListSerializer(serializers.Serializer):
     """
-    Simplified serializer for quiz listing.
+    Simplified, read-only serializer for quiz listing.
+
+    Rendered from .values() rows built by views.quiz_list_rows().
     """
 
-    course_name = serializers.CharField(source='course.name', read_only=True)
-    class_name_display = serializers.CharField(source='class_name.name', read_only=True)
-    question_count = serializers.SerializerMethodField()
-    total_points = serializers.SerializerMethodField()
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    class_name_display = serializers.CharField(read_only=True)
+    course_name = serializers.CharField(read_only=True)
+    passing_score = serializers.IntegerField(read_only=True)
+    question_count = serializers.IntegerField(read_only=True)
+    total_points = serializers.IntegerField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
-        model = Quiz
-        fields = [
-            'id',
-            'name',
-            'class_name_display',
-            'course_name',
-            'passing_score',
-            'question_count',
-            'total_points',
-            'created_at'
-        ]
-        read_only_fields = ['id', 'created_at']
-
-    def get_question_count(self, obj):
-        """Get the total number of questions in the quiz."""
-        return obj.questions.count()
-
-    def get_total_points(self, obj):
-        """Calculate total points for the quiz."""
-        return sum(q.question_point for q in obj.questions.all())
+        list_serializer_class = ValuesRowListSerializer
 
 
 class QuizUpdateSerializer(serializers.ModelSerializer):
@@ -434,7 +444,7 @@ class QuizUpdateSerializer(serializers.ModelSerializer):
     Serializer for updating quizzes.
     """
 
-    question_ids = serializers.PrimaryKeyRelatedField(
+    question_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=QuizQuestion.objects.all(),
         write_only=True,
@@ -454,13 +464,13 @@ class QuizUpdateSerializer(serializers.ModelSerializer):
         """Validate quiz update data."""
         # Validate that all questions belong to the same course as the quiz
         if 'questions' in attrs:
-            quiz_course = self.instance.course
-            for question in attrs['questions']:
-                if question.course != quiz_course:
-                    raise serializers.ValidationError({ 
-                        f"Question '{question.question_text[:50]}...' belongs to course '{question.course.name}', "
-                        f"but quiz is for course '{quiz_course.name}'"}
-                    )
+            question = first_question_outside_course(attrs['questions'], self.instance.course_id)
+            if question is not None:
+                quiz_course = self.instance.course
+                raise serializers.ValidationError({ 
+                    f"Question '{question.question_text[:50]}...' belongs to course '{question.course.name}', "
+                    f"but quiz is for course '{quiz_course.name}'"}
+                )
         
         # Validate passing score
         passing_score = attrs.get('passing_score')
@@ -484,6 +494,10 @@ class QuizUpdateSerializer(serializers.ModelSerializer):
         
         return instance
 
+    def to_representation(self, instance):
+        """Render the saved quiz in QuizSerializer's shape."""
+        return saved_quiz_representation(instance, self.context)
+
 
 class QuizAnswerSerializer(serializers.Serializer):
     """Serializer for individual quiz answer."""
@@ -539,8 +553,13 @@ class QuizSubmissionSerializer(serializers.Serializer):
         request = self.context.get('request')
         student = request.user
         
-        # Get quiz and all questions
-        quiz = Quiz.objects.prefetch_related('questions').get(id=quiz_id)
+        # The attempt is rendered with its course name, so join it here
+        quiz = Quiz.objects.select_related('course').get(id=quiz_id)
+        
+        # Load every answered question in one query
+        questions = QuizQuestion.objects.in_bulk(
+            {answer['question_id'] for answer in answers}
+        )
         
         # Calculate score
         score = 0
@@ -548,25 +567,25 @@ class QuizSubmissionSerializer(serializers.Serializer):
         results = []
         
         for answer in answers:
-            try:
-                question = QuizQuestion.objects.get(id=answer['question_id'])
-                total_points += question.question_point
-                
-                is_correct = question.correct_option == answer['selected_option']
-                if is_correct:
-                    score += question.question_point
-                
-                results.append({
-                    'question_id': question.id,
-                    'question_text': question.question_text,
-                    'selected_option': answer['selected_option'],
-                    'correct_option': question.correct_option,
-                    'is_correct': is_correct,
-                    'points_earned': question.question_point if is_correct else 0,
-                    'points_possible': question.question_point
-                })
-            except QuizQuestion.DoesNotExist:
+            question = questions.get(answer['question_id'])
+            if question is None:
                 continue
+            
+            total_points += question.question_point
+            
+            is_correct = question.correct_option == answer['selected_option']
+            if is_correct:
+                score += question.question_point
+            
+            results.append({
+                'question_id': question.id,
+                'question_text': question.question_text,
+                'selected_option': answer['selected_option'],
+                'correct_option': question.correct_option,
+                'is_correct': is_correct,
+                'points_earned': question.question_point if is_correct else 0,
+                'points_possible': question.question_point
+            })
         
         # Create quiz attempt (save method will calculate grade and progress_percentage)
         quiz_attempt = StudentQuizAttempt.objects.create(
@@ -576,10 +595,15 @@ class QuizSubmissionSerializer(serializers.Serializer):
             progress_percentage=0  # Will be calculated in save method
         )
         
+        passed = quiz_attempt.progress_percentage >= quiz.passing_score
+        message = f"Quiz submitted successfully! You scored {quiz_attempt.score} out of {total_points} points ({quiz_attempt.progress_percentage:.2f}%). Grade: {quiz_attempt.grade}. "
+        message += "You passed!" if passed else "You did not pass. Keep trying!"
+        
         return {
             'quiz_attempt': quiz_attempt,
             'results': results,
-            'total_points': total_points
+            'total_points': total_points,
+            'message': message
         }
 
 
@@ -609,10 +633,33 @@ class StudentQuizAttemptSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'grade', 'progress_percentage', 'attempted_at']
 
 
+class StudentQuizResultSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the requesting student's own attempts.
+
+    Rendered from .values() rows built by views.StudentQuizResultView.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    student = serializers.IntegerField(read_only=True)
+    student_name = serializers.CharField(read_only=True)
+    student_email = serializers.CharField(read_only=True)
+    quiz = serializers.IntegerField(read_only=True)
+    quiz_name = serializers.CharField(read_only=True)
+    course_name = serializers.CharField(read_only=True)
+    score = serializers.IntegerField(read_only=True)
+    grade = serializers.CharField(read_only=True, allow_null=True)
+    progress_percentage = serializers.FloatField(read_only=True)
+    attempted_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        list_serializer_class = ValuesRowListSerializer
+
+
 class QuizSubmissionResponseSerializer(serializers.Serializer):
-    """Serializer for quiz submission response."""
+    """Serializer for quiz submission response (renders QuizSubmissionSerializer.save()'s result)."""
     
-    attempt = StudentQuizAttemptSerializer()
+    attempt = StudentQuizAttemptSerializer(source='quiz_attempt')
     results = serializers.ListField(
         child=serializers.DictField()
     )
@@ -1,3 +1,60 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import Course, Lesson, Skills
+from .utils import list_cache_version
+
+
+class ListCacheVersionTestCase(TestCase):
+    """Test cases for versioned list cache invalidation."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_course_write_bumps_version_on_commit(self):
+        """Test that a course write bumps the version once it commits."""
+        before = list_cache_version("courses")
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(name="Algebra")
+            self.assertEqual(list_cache_version("courses"), before)
+        self.assertGreater(list_cache_version("courses"), before)
+
+    def test_nested_writes_bump_courses_version(self):
+        """Test that lesson and skill changes invalidate course responses."""
+        lesson = Lesson.objects.create(title="Fractions", duration=30)
+        skill = Skills.objects.create(name="Division")
+
+        before = list_cache_version("courses")
+        with self.captureOnCommitCallbacks(execute=True):
+            lesson.skills.add(skill)
+        self.assertGreater(list_cache_version("courses"), before)
+
+        before = list_cache_version("courses")
+        with self.captureOnCommitCallbacks(execute=True):
+            skill.name = "Long division"
+            skill.save()
+        self.assertGreater(list_cache_version("courses"), before)
+
+    @override_settings(SHARED_CACHE=True)
+    def test_cached_list_refreshed_after_write(self):
+        """Test that a cached course list is not served after a write."""
+        client = APIClient()
+        url = reverse("academics:course_list")
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(name="Algebra")
+        self.assertEqual(len(client.get(url).data["results"]), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(name="Geometry")
+        self.assertEqual(len(client.get(url).data["results"]), 2)
+
+    @override_settings(SHARED_CACHE=True)
+    def test_anonymous_head_honours_etag(self):
+        """Test that an anonymous HEAD on the course list can get a 304."""
+        client = APIClient()
+        url = reverse("academics:course_list")
+        etag = client.head(url)["ETag"]
+        response = client.head(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,26 @@
+"""
+Small helpers for the academics app.
+"""
+
+from django.core.cache import cache
+
+
+def _list_cache_version_key(namespace):
+    return f"academics:{namespace}:ver"
+
+
+def list_cache_version(namespace):
+    """Current version of a cached list namespace (0 until first bumped)."""
+    return cache.get(_list_cache_version_key(namespace), 0)
+
+
+def bump_list_cache_version(namespace):
+    """Invalidate every cached page of a list namespace by moving to a new version."""
+    key = _list_cache_version_key(namespace)
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
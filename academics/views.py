@@ -2,10 +2,24 @@
 Views for the academics app.
 """
 
+from django.conf import settings
+from django.db.models import CharField, Count, F, Max, Prefetch, Value
+from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from .mixins import (
+    AutoPrefetchMixin,
+    CheapMethodMixin,
+    VersionedDetailCacheMixin,
+    VersionedListCacheMixin,
+)
+from .pagination import IdCursorPagination
+from .renderers import LIST_RENDERER_CLASSES
+from .utils import list_cache_version
 from .models import Course, UploadCourseDocuments, Class, QuizQuestion, Quiz, StudentQuizAttempt
 from .serializers import (
     CourseSerializer,
@@ -22,20 +36,68 @@ from .serializers import (
     QuizUpdateSerializer,
     QuizSubmissionSerializer,
     QuizSubmissionResponseSerializer,
-    StudentQuizAttemptSerializer,
+    StudentQuizResultSerializer,
     QuizPerformanceSerializer,
 )
 
 
-class CourseListView(generics.ListAPIView):
+def quiz_list_rows(queryset):
+    """Shape a Quiz queryset into the .values() rows rendered by QuizListSerializer."""
+    return queryset.annotate(
+        course_name=F('course__name'),
+        class_name_display=F('class_name__name'),
+    ).values(
+        'id',
+        'name',
+        'class_name_display',
+        'course_name',
+        'passing_score',
+        'question_count',
+        'total_points',
+        'created_at',
+    )
+
+
+def course_etag(request, pk, **kwargs):
+    """
+    Weak ETag for a course detail response.
+
+    Edits to the units, lessons and skills it nests, and membership changes,
+    don't touch Course.updated_at, but they bump the 'courses' list-cache
+    version, so both go into the tag. Without a
+    shared cache the version is per worker, so no tag is sent.
+    """
+    if not settings.SHARED_CACHE:
+        return None
+    updated_at = Course.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        return None
+    return f'W/"{pk}-{updated_at.timestamp()}-{list_cache_version("courses")}"'
+
+
+def course_list_etag(request, *args, **kwargs):
+    """Weak ETag for the course list, from its size, latest update and cache version."""
+    if not settings.SHARED_CACHE:
+        return None
+    stats = Course.objects.aggregate(count=Count('id'), last=Max('updated_at'))
+    last = stats['last'].timestamp() if stats['last'] else 0
+    return f'W/"{stats["count"]}-{last}-{list_cache_version("courses")}"'
+
+
+class CourseListView(CheapMethodMixin, VersionedListCacheMixin, generics.ListAPIView):
     """
     API view for listing courses.
     
     GET: List all courses
     """
 
-    queryset = Course.objects.all()
+    queryset = Course.objects.annotate(_units_count=Count('units')).values(
+        'id', 'name', 'description', '_units_count', 'created_at', 'updated_at'
+    )
     serializer_class = CourseListSerializer
+    list_cache_namespace = 'courses'
+    pagination_class = IdCursorPagination
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -46,11 +108,12 @@ class CourseListView(generics.ListAPIView):
         },
         tags=['Academics']
     )
+    @method_decorator(condition(etag_func=course_list_etag))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
-class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CourseDetailView(AutoPrefetchMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting a course.
     
@@ -72,6 +135,7 @@ class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
         },
         tags=['Academics']
     )
+    @method_decorator(condition(etag_func=course_etag))
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
@@ -145,7 +209,7 @@ class UploadCourseDocumentView(generics.CreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class ClassListCreateView(generics.ListCreateAPIView):
+class ClassListCreateView(CheapMethodMixin, VersionedListCacheMixin, generics.ListCreateAPIView):
     """
     API view for listing and creating classes.
     
@@ -153,13 +217,18 @@ class ClassListCreateView(generics.ListCreateAPIView):
     POST: Create a new class
     """
 
-    queryset = Class.objects.all()
+    queryset = Class.objects.annotate(_course_count=Count('course')).values(
+        'id', 'name', 'learning_objectives', '_course_count', 'created_at', 'updated_at'
+    )
+    serializer_class = ClassListSerializer
+    serializer_classes = {'POST': ClassSerializer}
+    list_cache_namespace = 'classes'
+    pagination_class = IdCursorPagination
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_serializer_class(self):
-        if self.request.method == 'POST':
-            return ClassSerializer
-        return ClassListSerializer
+        return self.serializer_classes.get(self.request.method, self.serializer_class)
 
     @extend_schema(
         summary="List all classes",
@@ -196,7 +265,14 @@ class ClassDetailView(generics.RetrieveUpdateDestroyAPIView):
     DELETE: Delete class
     """
 
-    queryset = Class.objects.all()
+    queryset = Class.objects.prefetch_related(
+        Prefetch(
+            'course',
+            queryset=Course.objects.only(
+                'id', 'name', 'description', 'created_at', 'updated_at'
+            ).annotate(_units_count=Count('units')),
+        )
+    )
     serializer_class = ClassSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -261,15 +337,18 @@ class ClassDetailView(generics.RetrieveUpdateDestroyAPIView):
 # ============================================================================
 
 
-class QuizQuestionListView(generics.ListAPIView):
+class QuizQuestionListView(CheapMethodMixin, VersionedListCacheMixin, AutoPrefetchMixin, generics.ListAPIView):
     """
     API view for listing quiz questions.
     
     GET: List all quiz questions
     """
 
-    queryset = QuizQuestion.objects.all().select_related('course')
+    queryset = QuizQuestion.objects.all()
     serializer_class = QuizQuestionListSerializer
+    list_cache_namespace = 'quiz_questions'
+    pagination_class = IdCursorPagination
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -284,7 +363,7 @@ class QuizQuestionListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class QuizQuestionDetailView(generics.RetrieveUpdateDestroyAPIView):
+class QuizQuestionDetailView(AutoPrefetchMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting a quiz question.
     
@@ -293,7 +372,7 @@ class QuizQuestionDetailView(generics.RetrieveUpdateDestroyAPIView):
     DELETE: Delete quiz question
     """
 
-    queryset = QuizQuestion.objects.all().select_related('course')
+    queryset = QuizQuestion.objects.all()
     serializer_class = QuizQuestionSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -380,18 +459,18 @@ class QuizQuestionCreateView(generics.CreateAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        question = serializer.save()
+        serializer.save()
         
         return Response(
             {
                 "message": "Quiz question created successfully.",
-                "question": QuizQuestionSerializer(question).data,
+                "question": serializer.data,
             },
             status=status.HTTP_201_CREATED,
         )
 
 
-class QuizQuestionByCourseView(generics.ListAPIView):
+class QuizQuestionByCourseView(VersionedListCacheMixin, AutoPrefetchMixin, generics.ListAPIView):
     """
     API view for listing quiz questions by course.
     
@@ -399,6 +478,9 @@ class QuizQuestionByCourseView(generics.ListAPIView):
     """
 
     serializer_class = QuizQuestionListSerializer
+    list_cache_namespace = 'quiz_questions'
+    pagination_class = IdCursorPagination
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -414,9 +496,11 @@ class QuizQuestionByCourseView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        """Filter questions by course ID from URL."""
+        """Filter questions by course ID from URL; 404 if the course does not exist."""
         course_id = self.kwargs.get('course_id')
-        return QuizQuestion.objects.filter(course_id=course_id).select_related('course')
+        if not Course.objects.filter(pk=course_id).exists():
+            raise Http404("Course does not exist.")
+        return QuizQuestion.objects.filter(course_id=course_id).order_by('-id')
 
 
 # ============================================================================
@@ -424,15 +508,16 @@ class QuizQuestionByCourseView(generics.ListAPIView):
 # ============================================================================
 
 
-class QuizListView(generics.ListAPIView):
+class QuizListView(CheapMethodMixin, generics.ListAPIView):
     """
     API view for listing quizzes.
     
     GET: List all quizzes
     """
 
-    queryset = Quiz.objects.all().select_related('course', 'class_name', 'created_by').prefetch_related('questions')
+    queryset = quiz_list_rows(Quiz.objects.all())
     serializer_class = QuizListSerializer
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -447,15 +532,16 @@ class QuizListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class QuizDetailView(generics.RetrieveAPIView):
+class QuizDetailView(VersionedDetailCacheMixin, AutoPrefetchMixin, generics.RetrieveAPIView):
     """
     API view for retrieving quiz details.
     
     GET: Retrieve quiz details with all questions
     """
 
-    queryset = Quiz.objects.all().select_related('course', 'class_name', 'created_by').prefetch_related('questions')
+    queryset = Quiz.objects.all()
     serializer_class = QuizSerializer
+    detail_cache_namespace = 'quiz_detail'
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -498,12 +584,12 @@ class QuizCreateView(generics.CreateAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
-        quiz = serializer.save()
+        serializer.save()
         
         return Response(
             {
                 "message": "Quiz created successfully.",
-                "quiz": QuizSerializer(quiz).data,
+                "quiz": serializer.data,
             },
             status=status.HTTP_201_CREATED,
         )
@@ -545,7 +631,7 @@ class QuizUpdateView(generics.UpdateAPIView):
         return Response(
             {
                 "message": "Quiz updated successfully.",
-                "quiz": QuizSerializer(instance).data,
+                "quiz": serializer.data,
             }
         )
 
@@ -593,7 +679,7 @@ class QuizDeleteView(generics.DestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
-class QuizByCourseView(generics.ListAPIView):
+class QuizByCourseView(CheapMethodMixin, generics.ListAPIView):
     """
     API view for listing quizzes by course.
     
@@ -601,6 +687,7 @@ class QuizByCourseView(generics.ListAPIView):
     """
 
     serializer_class = QuizListSerializer
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -618,12 +705,10 @@ class QuizByCourseView(generics.ListAPIView):
     def get_queryset(self):
         """Filter quizzes by course ID from URL."""
         course_id = self.kwargs.get('course_id')
-        return Quiz.objects.filter(course_id=course_id).select_related(
-            'course', 'class_name', 'created_by'
-        ).prefetch_related('questions')
+        return quiz_list_rows(Quiz.objects.filter(course_id=course_id))
 
 
-class QuizByClassView(generics.ListAPIView):
+class QuizByClassView(CheapMethodMixin, generics.ListAPIView):
     """
     API view for listing quizzes by class.
     
@@ -631,6 +716,7 @@ class QuizByClassView(generics.ListAPIView):
     """
 
     serializer_class = QuizListSerializer
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     @extend_schema(
@@ -648,9 +734,7 @@ class QuizByClassView(generics.ListAPIView):
     def get_queryset(self):
         """Filter quizzes by class ID from URL."""
         class_id = self.kwargs.get('class_id')
-        return Quiz.objects.filter(class_name_id=class_id).select_related(
-            'course', 'class_name', 'created_by'
-        ).prefetch_related('questions')
+        return quiz_list_rows(Quiz.objects.filter(class_name_id=class_id))
 
 
 class QuizSubmitView(generics.CreateAPIView):
@@ -679,27 +763,13 @@ class QuizSubmitView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Create quiz attempt and calculate score
+        # Create quiz attempt, calculate score and build the message
         result = serializer.save()
         
-        quiz_attempt = result['quiz_attempt']
-        results = result['results']
-        total_points = result['total_points']
-        
-        # Prepare success message
-        passed = quiz_attempt.progress_percentage >= quiz_attempt.quiz.passing_score
-        message = f"Quiz submitted successfully! You scored {quiz_attempt.score} out of {total_points} points ({quiz_attempt.progress_percentage:.2f}%). Grade: {quiz_attempt.grade}. "
-        message += "You passed!" if passed else "You did not pass. Keep trying!"
-        
-        # Prepare response
-        response_data = {
-            'attempt': StudentQuizAttemptSerializer(quiz_attempt).data,
-            'results': results,
-            'total_points': total_points,
-            'message': message
-        }
-        
-        return Response(response_data, status=status.HTTP_201_CREATED)
+        return Response(
+            QuizSubmissionResponseSerializer(result).data,
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class StudentQuizResultView(generics.ListAPIView):
@@ -709,14 +779,15 @@ class StudentQuizResultView(generics.ListAPIView):
     GET: List all quiz results for the authenticated student
     """
 
-    serializer_class = StudentQuizAttemptSerializer
+    serializer_class = StudentQuizResultSerializer
+    renderer_classes = LIST_RENDERER_CLASSES
     permission_classes = [permissions.IsAuthenticated]
 
     @extend_schema(
         summary="List student quiz results",
         description="Retrieve a list of all quiz results for the authenticated student.",
         responses={
-            200: StudentQuizAttemptSerializer(many=True),
+            200: StudentQuizResultSerializer(many=True),
             401: "Unauthorized - Authentication required"
         },
         tags=['Quiz']
@@ -726,9 +797,29 @@ class StudentQuizResultView(generics.ListAPIView):
 
     def get_queryset(self):
         """Filter quiz attempts by the authenticated student."""
+        student = self.request.user
+        # Every row belongs to the request user, so their name and email are
+        # constants rather than a join on the user table
         return StudentQuizAttempt.objects.filter(
-            student=self.request.user
-        ).select_related('student', 'quiz', 'quiz__course').order_by('-attempted_at')
+            student=student
+        ).annotate(
+            quiz_name=F('quiz__name'),
+            course_name=F('quiz__course__name'),
+            student_name=Value(student.full_name, output_field=CharField()),
+            student_email=Value(student.email, output_field=CharField()),
+        ).values(
+            'id',
+            'student',
+            'student_name',
+            'student_email',
+            'quiz',
+            'quiz_name',
+            'course_name',
+            'score',
+            'grade',
+            'progress_percentage',
+            'attempted_at',
+        ).order_by('-attempted_at')
 
 
 class StudentQuizPerformanceView(generics.ListAPIView):
@@ -754,28 +845,34 @@ class StudentQuizPerformanceView(generics.ListAPIView):
         return self.list(request, *args, **kwargs)
 
     def get_queryset(self):
-        """Return performance data for all quizzes."""
+        """
+        Return all quizzes, each with the student's attempts (newest first)
+        prefetched as `student_attempts` in one extra query.
+        """
         student = self.request.user
         
-        # Get all quizzes
-        quizzes = Quiz.objects.select_related('course', 'class_name').prefetch_related('questions')
-        
-        performance_data = []
-        
+        return Quiz.objects.select_related('course', 'class_name').prefetch_related(
+            Prefetch(
+                'attempts',
+                queryset=StudentQuizAttempt.objects.filter(student=student)
+                .select_related('student')
+                .order_by('-attempted_at', '-id'),
+                to_attr='student_attempts',
+            )
+        ).order_by('id')
+
+    def get_performance_data(self, quizzes):
+        """Yield the performance row for each quiz from its prefetched attempts."""
         for quiz in quizzes:
-            # Get all attempts for this quiz by the student
-            attempts = StudentQuizAttempt.objects.filter(
-                student=student,
-                quiz=quiz
-            ).order_by('-attempted_at')
+            attempts = quiz.student_attempts
             
             # Calculate statistics
-            total_attempts = attempts.count()
+            total_attempts = len(attempts)
             is_attempted = total_attempts > 0
             
             if is_attempted:
-                best_attempt = attempts.order_by('-score').first()
-                latest_attempt = attempts.first()
+                best_attempt = max(attempts, key=lambda attempt: attempt.score)
+                latest_attempt = attempts[0]
                 
                 best_score = best_attempt.score
                 best_grade = best_attempt.grade
@@ -792,15 +889,12 @@ class StudentQuizPerformanceView(generics.ListAPIView):
                 latest_score = latest_grade = latest_percentage = latest_attempt_date = None
                 has_passed = False
             
-            # Calculate total points
-            total_points = sum(q.question_point for q in quiz.questions.all())
-            
-            performance_data.append({
+            yield {
                 'quiz_id': quiz.id,
                 'quiz_name': quiz.name,
                 'course_name': quiz.course.name,
                 'class_name': quiz.class_name.name,
-                'total_points': total_points,
+                'total_points': quiz.total_points,
                 'passing_score': quiz.passing_score,
                 'total_attempts': total_attempts,
                 'best_score': best_score,
@@ -812,13 +906,15 @@ class StudentQuizPerformanceView(generics.ListAPIView):
                 'latest_attempt_date': latest_attempt_date,
                 'has_passed': has_passed,
                 'is_attempted': is_attempted,
-                'attempts': list(attempts)
-            })
-        
-        return performance_data
+                'attempts': attempts
+            }
     
     def list(self, request, *args, **kwargs):
-        """Return the performance data."""
+        """Return the performance data for the requested page of quizzes."""
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(self.get_performance_data(page), many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(self.get_performance_data(queryset), many=True)
         return Response(serializer.data)
@@ -7,10 +7,7 @@ This module registers models with the Django admin interface.
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
-from .models import OTPToken, PasswordResetToken, User
-from django.contrib.auth.models import Group
-
-admin.site.unregister(Group)
+from .models import OTPToken, User
 
 
 @admin.register(User)
@@ -114,9 +111,9 @@ class OTPTokenAdmin(admin.ModelAdmin):
         "is_valid_display",
     ]
     list_filter = ["purpose", "is_used", "created_at"]
-    search_fields = ["user__email", "token"]
+    search_fields = ["user__email"]
     ordering = ["-created_at"]
-    readonly_fields = ["token", "created_at"]
+    readonly_fields = ["token_hash", "created_at"]
 
     def is_valid_display(self, obj):
         """Display whether the OTP is valid."""
@@ -125,28 +122,3 @@ class OTPTokenAdmin(admin.ModelAdmin):
     is_valid_display.boolean = True
     is_valid_display.short_description = "Valid"
 
-
-@admin.register(PasswordResetToken)
-class PasswordResetTokenAdmin(admin.ModelAdmin):
-    """
-    Admin configuration for password reset tokens.
-    """
-
-    list_display = [
-        "user",
-        "is_used",
-        "created_at",
-        "expires_at",
-        "is_valid_display",
-    ]
-    list_filter = ["is_used", "created_at"]
-    search_fields = ["user__email"]
-    ordering = ["-created_at"]
-    readonly_fields = ["token", "created_at"]
-
-    def is_valid_display(self, obj):
-        """Display whether the token is valid."""
-        return obj.is_valid
-
-    is_valid_display.boolean = True
-    is_valid_display.short_description = "Valid"
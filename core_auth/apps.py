@@ -16,4 +16,10 @@ class CoreAuthConfig(AppConfig):
 
         This is a good place to import signal handlers.
         """
-        pass  # Import signals here if needed in the future
+        from django.contrib import admin
+        from django.contrib.auth.models import Group
+
+        # Groups aren't used; hide them from the admin. AdminConfig.ready()
+        # (listed first in INSTALLED_APPS) has already registered them.
+        if admin.site.is_registered(Group):
+            admin.site.unregister(Group)
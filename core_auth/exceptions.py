@@ -5,6 +5,8 @@ This module provides a custom exception handler for DRF
 that formats error responses consistently.
 """
 
+from functools import lru_cache
+
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.http import Http404
 from rest_framework import exceptions, status
@@ -12,6 +14,75 @@ from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
 
+def _format_validation_error(exc, data):
+    return {"errors": data}
+
+
+def _format_authentication_failed(exc, data):
+    return {
+        "error": "Authentication failed",
+        "detail": (
+            str(exc.detail) if hasattr(exc, "detail") else "Invalid credentials"
+        ),
+    }
+
+
+def _format_not_authenticated(exc, data):
+    return {
+        "error": "Not authenticated",
+        "detail": "Authentication credentials were not provided.",
+    }
+
+
+def _format_permission_denied(exc, data):
+    return {
+        "error": "Permission denied",
+        "detail": (
+            str(exc.detail)
+            if hasattr(exc, "detail")
+            else "You do not have permission to perform this action."
+        ),
+    }
+
+
+def _format_not_found(exc, data):
+    return {
+        "error": "Not found",
+        "detail": "The requested resource was not found.",
+    }
+
+
+def _format_throttled(exc, data):
+    return {
+        "error": "Too many requests",
+        "detail": f"Request was throttled. Try again in {exc.wait} seconds.",
+        "retry_after": exc.wait,
+    }
+
+
+# Response body formatters by exception class. None of these classes
+# subclasses another, so the first match along an exception's MRO is the
+# only match.
+_RESPONSE_FORMATTERS = {
+    exceptions.ValidationError: _format_validation_error,
+    exceptions.AuthenticationFailed: _format_authentication_failed,
+    exceptions.NotAuthenticated: _format_not_authenticated,
+    exceptions.PermissionDenied: _format_permission_denied,
+    Http404: _format_not_found,
+    exceptions.Throttled: _format_throttled,
+}
+
+
+@lru_cache(maxsize=None)
+def _formatter_for(exc_class):
+    """Return the formatter for `exc_class` or its nearest listed base, or None."""
+    for klass in exc_class.__mro__:
+        formatter = _RESPONSE_FORMATTERS.get(klass)
+        if formatter is not None:
+            return formatter
+    return None
+
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler for Django REST Framework.
@@ -51,40 +122,9 @@ def custom_exception_handler(exc, context):
         )
 
     # Customize the response format
-    if isinstance(exc, exceptions.ValidationError):
-        response.data = {"errors": response.data}
-    elif isinstance(exc, exceptions.AuthenticationFailed):
-        response.data = {
-            "error": "Authentication failed",
-            "detail": (
-                str(exc.detail) if hasattr(exc, "detail") else "Invalid credentials"
-            ),
-        }
-    elif isinstance(exc, exceptions.NotAuthenticated):
-        response.data = {
-            "error": "Not authenticated",
-            "detail": "Authentication credentials were not provided.",
-        }
-    elif isinstance(exc, exceptions.PermissionDenied):
-        response.data = {
-            "error": "Permission denied",
-            "detail": (
-                str(exc.detail)
-                if hasattr(exc, "detail")
-                else "You do not have permission to perform this action."
-            ),
-        }
-    elif isinstance(exc, Http404):
-        response.data = {
-            "error": "Not found",
-            "detail": "The requested resource was not found.",
-        }
-    elif isinstance(exc, exceptions.Throttled):
-        response.data = {
-            "error": "Too many requests",
-            "detail": f"Request was throttled. Try again in {exc.wait} seconds.",
-            "retry_after": exc.wait,
-        }
+    formatter = _formatter_for(type(exc))
+    if formatter is not None:
+        response.data = formatter(exc, response.data)
 
     return response
 
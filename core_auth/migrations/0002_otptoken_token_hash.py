@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-15 23:41
+
+from django.db import migrations, models
+from django.utils.crypto import salted_hmac
+
+
+def hash_unused_tokens(apps, schema_editor):
+    """Store the digest of OTPs that can still be redeemed (see OTPToken.hash_token)."""
+    OTPToken = apps.get_model("core_auth", "OTPToken")
+    for otp_token in OTPToken.objects.filter(is_used=False).only("pk", "token"):
+        otp_token.token_hash = salted_hmac(
+            "core_auth.OTPToken", otp_token.token, algorithm="sha256"
+        ).hexdigest()
+        otp_token.save(update_fields=["token_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_auth", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="otptoken",
+            name="token_hash",
+            field=models.CharField(default="", max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(hash_unused_tokens, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="otptoken",
+            name="core_auth_o_token_038603_idx",
+        ),
+        migrations.RemoveField(
+            model_name="otptoken",
+            name="token",
+        ),
+    ]
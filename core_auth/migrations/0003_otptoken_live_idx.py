@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-15 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_auth", "0002_otptoken_token_hash"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="otptoken",
+            name="core_auth_o_user_id_baf149_idx",
+        ),
+        migrations.AddIndex(
+            model_name="otptoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["user", "purpose"],
+                name="otp_live_idx",
+            ),
+        ),
+    ]
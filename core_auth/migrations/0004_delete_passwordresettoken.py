@@ -0,0 +1,16 @@
+# Generated by Django 6.0 on 2026-10-16 00:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_auth", "0003_otptoken_live_idx"),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name="PasswordResetToken",
+        ),
+    ]
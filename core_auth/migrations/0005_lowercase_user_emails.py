@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-16 00:40
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model("core_auth", "User")
+    taken = set(User.objects.values_list("email", flat=True))
+    for pk, email in User.objects.exclude(email=Lower("email")).values_list("pk", "email"):
+        # Leave addresses whose lowercase form belongs to another account
+        if email.lower() not in taken:
+            User.objects.filter(pk=pk).update(email=email.lower())
+            taken.add(email.lower())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_auth", "0004_delete_passwordresettoken"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -6,15 +6,19 @@ as well as OTP models for password reset and profile verification.
 """
 
 import secrets
-import string
 from datetime import timedelta
+from functools import partial
 from django.core.validators import MaxLengthValidator
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import models, transaction
+from django.db.models import Q
 from django.dispatch import receiver
 from django.utils import timezone
-from django.db.models.signals import post_save, pre_save
+from django.utils.crypto import salted_hmac
+from django.db.models.signals import post_save
 from Profile.models import StudentProfile, TeacherProfile, ParentProfile
 
 class UserManager(BaseUserManager):
@@ -24,6 +28,14 @@ class UserManager(BaseUserManager):
     Provides helper methods for creating regular users and superusers.
     """
 
+    @classmethod
+    def normalize_email(cls, email):
+        """
+        Lowercase the whole address (not just the domain), so lookups can
+        compare it exactly and use the unique index on email.
+        """
+        return super().normalize_email(email).lower()
+
     def create_user(self, email, password=None, **extra_fields):
         """
         Create and return a regular user with the given email and password.
@@ -107,19 +119,39 @@ class User(AbstractUser):
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
         return self.first_name or self.last_name or self.email
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored value so post_save can spot False -> True
+        # without re-reading the row (None if the field was deferred)
+        instance._prev_is_email_verified = instance.__dict__.get("is_email_verified")
+        return instance
     
 
-@receiver(pre_save, sender=User)
-def _capture_email_verified_state(sender, instance, **kwargs):
+def unknown_email_cache_key(email):
+    """Cache key marking an email address that has no account."""
+    return f"core_auth:unknown_email:{email.lower()}"
+
+
+@receiver(post_save, sender=User)
+def _forget_unknown_email(sender, instance, update_fields=None, **kwargs):
     """
-    Store previous is_email_verified on the instance so post_save can compare.
+    A save may give an address that was cached as unknown an account.
+    Cleared on commit, so a concurrent lookup can't re-mark it meanwhile.
     """
-    if not instance.pk:
-        instance._prev_is_email_verified = False
-        return
+    if update_fields is None or "email" in update_fields:
+        transaction.on_commit(
+            partial(cache.delete, unknown_email_cache_key(instance.email))
+        )
+
 
-    prev = User.objects.filter(pk=instance.pk).values_list("is_email_verified", flat=True).first()
-    instance._prev_is_email_verified = bool(prev)
+# Profile created for each role once its email is verified
+_PROFILE_MODEL_MAP = {
+    "student": StudentProfile,
+    "teacher": TeacherProfile,
+    "parent": ParentProfile,
+}
 
 
 @receiver(post_save, sender=User)
@@ -127,26 +159,45 @@ def create_profile_when_email_verified(sender, instance, created, **kwargs):
     """
     Create role profile only when email becomes verified (False -> True).
     """
-    if not instance.is_email_verified:
+    prev_is_email_verified = getattr(instance, "_prev_is_email_verified", False)
+    # The saved value is what the next save compares against
+    instance._prev_is_email_verified = instance.is_email_verified
+
+    profile_model = _PROFILE_MODEL_MAP.get(instance.role)
+    if not profile_model or not instance.is_email_verified:
         return
 
-    # create ONLY when it just turned True, or when user is created already verified
-    just_verified = created or (getattr(instance, "_prev_is_email_verified", False) is False)
+    # create ONLY when it just turned True, or when user is created already
+    # verified; an unknown previous value (deferred field) is treated as
+    # False, which is safe because the insert below skips existing profiles
+    just_verified = created or prev_is_email_verified is not True
 
     if not just_verified:
         return
 
-    profile_model_map = {
-        "student": StudentProfile,
-        "teacher": TeacherProfile,
-        "parent": ParentProfile,
-    }
+    # One INSERT that skips an existing profile, instead of get_or_create's
+    # SELECT + INSERT; bulk_create bypasses save(), so set the id here
+    profile_model.objects.bulk_create(
+        [profile_model(pk=profile_model.id_for_user(instance), user=instance)],
+        ignore_conflicts=True,
+    )
+
 
-    profile_model = profile_model_map.get(instance.role)
-    if not profile_model:
-        return
+def _load_otp_settings():
+    global _OTP_LENGTH, _OTP_EXPIRY_MINUTES
+    auth_features = getattr(settings, "AUTH_FEATURES", {})
+    _OTP_LENGTH = auth_features.get("OTP_LENGTH", 4)
+    _OTP_EXPIRY_MINUTES = auth_features.get("OTP_EXPIRY_MINUTES", 10)
+
+
+_load_otp_settings()
+
+
+@receiver(setting_changed)
+def _reload_otp_settings(setting, **kwargs):
+    if setting == "AUTH_FEATURES":
+        _load_otp_settings()
 
-    profile_model.objects.get_or_create(user=instance)
 
 class OTPToken(models.Model):
     """
@@ -164,7 +215,8 @@ class OTPToken(models.Model):
         CHANGE_PASSWORD = "change_password", "Change Password"
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="otp_tokens")
-    token = models.CharField(max_length=10, db_index=True)
+    # HMAC of the code; the plain code is only ever emailed
+    token_hash = models.CharField(max_length=64)
     purpose = models.CharField(max_length=20, choices=OTPPurpose.choices)
     is_used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -175,13 +227,24 @@ class OTPToken(models.Model):
         verbose_name_plural = "OTP Tokens"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["token", "purpose"]),
-            models.Index(fields=["user", "purpose", "is_used"]),
+            # Only live codes are ever looked up; used ones stay out of the index
+            models.Index(
+                fields=["user", "purpose"],
+                condition=Q(is_used=False),
+                name="otp_live_idx",
+            ),
         ]
 
     def __str__(self):
         return f"OTP for {self.user.email} - {self.purpose}"
 
+    @staticmethod
+    def hash_token(token):
+        """Return the stored digest of an OTP code (HMAC-SHA256 keyed by SECRET_KEY)."""
+        return salted_hmac(
+            "core_auth.OTPToken", token, algorithm="sha256"
+        ).hexdigest()
+
     @property
     def is_expired(self):
         """Check if the OTP token has expired."""
@@ -192,11 +255,6 @@ class OTPToken(models.Model):
         """Check if the OTP token is valid (not used and not expired)."""
         return not self.is_used and not self.is_expired
 
-    def mark_as_used(self):
-        """Mark the OTP token as used."""
-        self.is_used = True
-        self.save(update_fields=["is_used"])
-
     @classmethod
     def generate_otp(cls, length=None):
         """
@@ -209,9 +267,10 @@ class OTPToken(models.Model):
             str: The generated OTP code.
         """
         if length is None:
-            length = getattr(settings, "AUTH_FEATURES", {}).get("OTP_LENGTH", 4)
+            length = _OTP_LENGTH
 
-        return "".join(secrets.choice(string.digits) for _ in range(length))
+        # One draw for the whole code rather than one per digit
+        return f"{secrets.randbelow(10 ** length):0{length}d}"
 
     @classmethod
     def create_otp(cls, user, purpose):
@@ -225,90 +284,27 @@ class OTPToken(models.Model):
             purpose: The purpose of the OTP (from OTPPurpose choices).
 
         Returns:
-            OTPToken: The created OTP token instance.
+            OTPToken: The created OTP token instance, with the plain code
+            available as `token` (it is not stored).
         """
-        # Invalidate existing unused tokens for the same purpose
-        cls.objects.filter(user=user, purpose=purpose, is_used=False).update(
-            is_used=True
-        )
-
-        # Get expiry time from settings
-        expiry_minutes = getattr(settings, "AUTH_FEATURES", {}).get(
-            "OTP_EXPIRY_MINUTES", 10
-        )
-
-        # Create new OTP token
-        otp_token = cls.objects.create(
-            user=user,
-            token=cls.generate_otp(),
-            purpose=purpose,
-            expires_at=timezone.now() + timedelta(minutes=expiry_minutes),
-        )
+        expiry_minutes = _OTP_EXPIRY_MINUTES
+        token = cls.generate_otp()
+
+        # Retire the old tokens and store the new one in one transaction
+        # (a single commit, and never two live tokens)
+        with transaction.atomic():
+            # Delete existing unused tokens for the same purpose; marking
+            # them used would make them look verified to reset_password
+            cls.objects.filter(user=user, purpose=purpose, is_used=False).delete()
+
+            # Create new OTP token
+            otp_token = cls.objects.create(
+                user=user,
+                token_hash=cls.hash_token(token),
+                purpose=purpose,
+                expires_at=timezone.now() + timedelta(minutes=expiry_minutes),
+            )
+        # Only the hash is stored; keep the code on the instance for sending
+        otp_token.token = token
 
         return otp_token
-
-
-class PasswordResetToken(models.Model):
-    """
-    Model to store password reset tokens.
-
-    This is an alternative to OTP-based password reset,
-    using a longer token sent via email link.
-    """
-
-    user = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name="password_reset_tokens"
-    )
-    token = models.CharField(max_length=100, unique=True, db_index=True)
-    is_used = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
-
-    class Meta:
-        verbose_name = "Password Reset Token"
-        verbose_name_plural = "Password Reset Tokens"
-        ordering = ["-created_at"]
-
-    def __str__(self):
-        return f"Password reset for {self.user.email}"
-
-    @property
-    def is_expired(self):
-        """Check if the reset token has expired."""
-        return timezone.now() > self.expires_at
-
-    @property
-    def is_valid(self):
-        """Check if the reset token is valid."""
-        return not self.is_used and not self.is_expired
-
-    def mark_as_used(self):
-        """Mark the reset token as used."""
-        self.is_used = True
-        self.save(update_fields=["is_used"])
-
-    @classmethod
-    def generate_token(cls):
-        """Generate a secure random token."""
-        return secrets.token_urlsafe(64)
-
-    @classmethod
-    def create_token(cls, user, expiry_hours=24):
-        """
-        Create a new password reset token for the user.
-
-        Args:
-            user: The user to create token for.
-            expiry_hours: Hours until the token expires.
-
-        Returns:
-            PasswordResetToken: The created token instance.
-        """
-        # Invalidate existing tokens
-        cls.objects.filter(user=user, is_used=False).update(is_used=True)
-
-        return cls.objects.create(
-            user=user,
-            token=cls.generate_token(),
-            expires_at=timezone.now() + timedelta(hours=expiry_hours),
-        )
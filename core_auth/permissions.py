@@ -6,9 +6,44 @@ the AUTH_FEATURES configuration settings.
 """
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from rest_framework import permissions
 
 
+def _load_auth_features():
+    global _ENABLE_PASSWORD_RESET, _ENABLE_PROFILE_EDIT
+    auth_features = getattr(settings, "AUTH_FEATURES", {})
+    _ENABLE_PASSWORD_RESET = auth_features.get("ENABLE_PASSWORD_RESET", True)
+    _ENABLE_PROFILE_EDIT = auth_features.get("ENABLE_PROFILE_EDIT", True)
+
+
+# Read once at import; permissions run on every request
+_load_auth_features()
+
+
+@receiver(setting_changed)
+def _reload_auth_features(setting, **kwargs):
+    if setting == "AUTH_FEATURES":
+        _load_auth_features()
+
+
+def _user_facts(request):
+    """
+    (is_authenticated, role, is_email_verified) for the request's user,
+    computed on first use and shared by every permission on the request.
+    """
+    facts = getattr(request, "_auth_cache", None)
+    if facts is None:
+        user = request.user
+        if user and user.is_authenticated:
+            facts = (True, getattr(user, "role", None), user.is_email_verified)
+        else:
+            facts = (False, None, False)
+        request._auth_cache = facts
+    return facts
+
+
 class IsAuthenticatedOrReadOnly(permissions.BasePermission):
     """
     Custom permission to allow read-only access for unauthenticated users.
@@ -30,8 +65,7 @@ class IsPasswordResetEnabled(permissions.BasePermission):
     message = "Password reset functionality is currently disabled."
 
     def has_permission(self, request, view):
-        auth_features = getattr(settings, "AUTH_FEATURES", {})
-        return auth_features.get("ENABLE_PASSWORD_RESET", True)
+        return _ENABLE_PASSWORD_RESET
 
 
 class IsProfileEditEnabled(permissions.BasePermission):
@@ -44,8 +78,7 @@ class IsProfileEditEnabled(permissions.BasePermission):
     message = "Profile editing functionality is currently disabled."
 
     def has_permission(self, request, view):
-        auth_features = getattr(settings, "AUTH_FEATURES", {})
-        return auth_features.get("ENABLE_PROFILE_EDIT", True)
+        return _ENABLE_PROFILE_EDIT
 
 
 class IsEmailVerified(permissions.BasePermission):
@@ -56,11 +89,8 @@ class IsEmailVerified(permissions.BasePermission):
     message = "Please verify your email address to access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and request.user.is_email_verified
-        )
+        is_authenticated, _, is_email_verified = _user_facts(request)
+        return is_authenticated and is_email_verified
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -103,11 +133,7 @@ class IsTeacher(permissions.BasePermission):
     message = "You must be a teacher to access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and getattr(request.user, "role", None) == "teacher"
-        )
+        return _user_facts(request)[1] == "teacher"
     
 
 class IsStudent(permissions.BasePermission):
@@ -118,11 +144,7 @@ class IsStudent(permissions.BasePermission):
     message = "You must be a student to access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and getattr(request.user, "role", None) == "student"
-        )
+        return _user_facts(request)[1] == "student"
         
 
 class IsParent(permissions.BasePermission):
@@ -133,8 +155,4 @@ class IsParent(permissions.BasePermission):
     message = "You must be a parent to access this resource."
 
     def has_permission(self, request, view):
-        return (
-            request.user
-            and request.user.is_authenticated
-            and getattr(request.user, "role", None) == "parent"
-        )
\ No newline at end of file
+        return _user_facts(request)[1] == "parent"
\ No newline at end of file
@@ -9,6 +9,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
 User = get_user_model()
 
@@ -80,6 +81,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             "role",
         ]
         extra_kwargs = {
+            # Emails are stored lowercased, so compare case-insensitively
+            "email": {
+                "validators": [
+                    UniqueValidator(
+                        queryset=User.objects.all(),
+                        lookup="iexact",
+                        message="user with this email already exists.",
+                    )
+                ]
+            },
             "first_name": {"required": False},
             "last_name": {"required": False},
         }
@@ -94,9 +105,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Create a new user with the validated data."""
-        validated_data.pop("confirm_password")
-        user = User.objects.create_user(**validated_data)
-        return user
+        # Pass the model fields by name; confirm_password is left behind
+        extra_fields = {
+            field: validated_data[field]
+            for field in ("first_name", "last_name", "role")
+            if field in validated_data
+        }
+        return User.objects.create_user(
+            email=validated_data["email"],
+            password=validated_data["password"],
+            **extra_fields,
+        )
 
 
 class LoginSerializer(serializers.Serializer):
@@ -6,32 +6,61 @@ Simple function-based services for authentication, OTP, and email operations.
 
 import logging
 from datetime import timedelta
+from functools import partial
 from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import OTPToken
+from .models import OTPToken, unknown_email_cache_key
 from .tasks import send_password_reset_otp_email_task, send_email_verification_otp_task
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# How long an address with no account is remembered
+UNKNOWN_EMAIL_CACHE_TIMEOUT = 60
+
 
 # =============================================================================
 # USER OPERATIONS
 # =============================================================================
 
-def get_user_by_email(email: str) -> Optional[User]:
-    """Get a user by email address."""
+def _find_user_by_email(queryset, email: str) -> Optional[User]:
+    # Retries against an unknown address (repeated reset requests) are
+    # answered from the cache; saving a user clears the marker. Needs a
+    # cache all workers share, or a new account would stay unknown elsewhere.
+    key = unknown_email_cache_key(email)
+    if settings.SHARED_CACHE and cache.get(key):
+        return None
     try:
-        return User.objects.get(email=email.lower())
+        return queryset.get(email=email.lower())
     except User.DoesNotExist:
+        if settings.SHARED_CACHE:
+            cache.set(key, True, UNKNOWN_EMAIL_CACHE_TIMEOUT)
         return None
 
 
+def get_user_by_email(email: str) -> Optional[User]:
+    """Get a user by email address."""
+    return _find_user_by_email(User.objects, email)
+
+
+def get_user_identity_by_email(email: str) -> Optional[User]:
+    """
+    Get a user by email address, loading only what addressing an email
+    needs (id, email and name). Not for users that will be saved.
+    """
+    return _find_user_by_email(
+        User.objects.only("id", "email", "first_name", "last_name"), email
+    )
+
+
 def create_user(email: str, password: str, **kwargs) -> User:
     """Create a new user."""
     return User.objects.create_user(
@@ -76,7 +105,7 @@ def blacklist_token(refresh_token: str) -> bool:
         token = RefreshToken(refresh_token)
         token.blacklist()
         return True
-    except Exception as e:
+    except TokenError as e:
         logger.error("Failed to blacklist refresh token", exc_info=e)
         return False
 
@@ -90,6 +119,23 @@ def generate_otp(user: User, purpose: str) -> OTPToken:
     return OTPToken.create_otp(user, purpose)
 
 
+def _live_otps(otp: str, purpose: str, **user_lookup):
+    """Unused, unexpired OTPs for the user matching the submitted code."""
+    # Codes are stored as HMAC digests, so the match happens in the query
+    return OTPToken.objects.filter(
+        **user_lookup,
+        purpose=purpose,
+        is_used=False,
+        token_hash=OTPToken.hash_token(otp),
+        expires_at__gte=timezone.now(),
+    )
+
+
+def verify_and_consume_otp(email: str, otp: str, purpose: str) -> bool:
+    """Verify an OTP by email and mark it used, in a single UPDATE."""
+    return _live_otps(otp, purpose, user__email=email.lower()).update(is_used=True) > 0
+
+
 def verify_otp(
     user: User,
     otp: str,
@@ -97,24 +143,10 @@ def verify_otp(
     validate_only: bool = False
 ) -> bool:
     """Verify an OTP for the user."""
-    try:
-        otp_token = OTPToken.objects.get(
-            user=user,
-            token=otp,
-            purpose=purpose,
-            is_used=False,
-        )
-
-        if not otp_token.is_valid:
-            return False
-
-        if not validate_only:
-            otp_token.mark_as_used()
-
-        return True
-
-    except OTPToken.DoesNotExist:
-        return False
+    live = _live_otps(otp, purpose, user=user)
+    if validate_only:
+        return live.exists()
+    return live.update(is_used=True) > 0
 
 
 # =============================================================================
@@ -133,7 +165,7 @@ def request_password_reset_otp(email: str) -> bool:
     Step 1 of forgot password flow.
     Returns True if email was sent successfully, False otherwise.
     """
-    user = get_user_by_email(email)
+    user = get_user_identity_by_email(email)
     if not user:
         return False
 
@@ -143,43 +175,39 @@ def request_password_reset_otp(email: str) -> bool:
 
 def verify_reset_otp(email: str, otp: str) -> bool:
     """Step 2: Verify and consume the OTP."""
-    user = get_user_by_email(email)
-    if not user:
-        return False
-
-    return verify_otp(
-        user,
-        otp,
-        OTPToken.OTPPurpose.PASSWORD_RESET,
-        validate_only=False,
+    return verify_and_consume_otp(
+        email, otp, OTPToken.OTPPurpose.PASSWORD_RESET
     )
 
 
 def reset_password(email: str, new_password: str) -> bool:
     """Step 3: Reset password if OTP was recently verified."""
-    user = get_user_by_email(email)
-    if not user:
-        return False
-
-    # Check if there's a recently used OTP (within last 10 minutes)
     recent_time = timezone.now() - timedelta(minutes=10)
-    recent_otp = OTPToken.objects.filter(
-        user=user,
-        purpose=OTPToken.OTPPurpose.PASSWORD_RESET,
-        is_used=True,
-        created_at__gte=recent_time
-    ).exists()
-
-    if recent_otp:
+    with transaction.atomic():
+        # Find a recently used OTP (within last 10 minutes) and load its
+        # user in the same query; the row lock makes a concurrent reset
+        # with the same OTP skip it instead of succeeding twice
+        recent_otp = OTPToken.objects.select_related("user").select_for_update(
+            skip_locked=True, of=("self",)
+        ).filter(
+            user__email=email.lower(),
+            purpose=OTPToken.OTPPurpose.PASSWORD_RESET,
+            is_used=True,
+            created_at__gte=recent_time
+        ).first()
+
+        if recent_otp is None:
+            return False
+
+        user = recent_otp.user
         change_password(user, new_password)
-        # Invalidate all password reset OTPs for this user
+        # Consume every password reset OTP of the user, including the one
+        # just used, so it can't authorize another reset
         OTPToken.objects.filter(
             user=user,
-            purpose=OTPToken.OTPPurpose.PASSWORD_RESET
-        ).update(is_used=True)
-        return True
-
-    return False
+            purpose=OTPToken.OTPPurpose.PASSWORD_RESET,
+        ).delete()
+    return True
 
 
 # =============================================================================
@@ -196,8 +224,11 @@ def send_verification_email(user: User) -> OTPToken:
 def verify_email(user: User, otp: str) -> bool:
     """Verify user's email with OTP."""
     if verify_otp(user, otp, OTPToken.OTPPurpose.EMAIL_VERIFICATION):
-        user.is_email_verified = True
-        user.save(update_fields=["is_email_verified"])
+        # save() rather than update(): post_save creates the role profile.
+        # Re-verifying an already verified user writes nothing.
+        if not user.is_email_verified:
+            user.is_email_verified = True
+            user.save(update_fields=["is_email_verified"])
         return True
     return False
 
@@ -209,12 +240,14 @@ def verify_email(user: User, otp: str) -> bool:
 def send_password_reset_otp_email(user: User, otp: str) -> bool:
     """Send password reset OTP email asynchronously using Celery."""
     try:
-        # Send email asynchronously using Celery task
-        send_password_reset_otp_email_task.delay(
+        # Enqueue once the OTP row is committed, so the worker never races
+        # the transaction (runs immediately outside atomic blocks)
+        transaction.on_commit(partial(
+            send_password_reset_otp_email_task.delay,
             user_email=user.email,
             user_full_name=user.full_name or user.email,
             otp=otp
-        )
+        ))
         logger.info(f"Password reset OTP email task queued for {user.email}")
         return True
     except Exception as e:
@@ -225,12 +258,14 @@ def send_password_reset_otp_email(user: User, otp: str) -> bool:
 def send_email_verification_otp(user: User, otp: str) -> bool:
     """Send email verification OTP asynchronously using Celery."""
     try:
-        # Send email asynchronously using Celery task
-        send_email_verification_otp_task.delay(
+        # Enqueue once the OTP row is committed, so the worker never races
+        # the transaction (runs immediately outside atomic blocks)
+        transaction.on_commit(partial(
+            send_email_verification_otp_task.delay,
             user_email=user.email,
             user_full_name=user.full_name or user.email,
             otp=otp
-        )
+        ))
         logger.info(f"Email verification OTP task queued for {user.email}")
         return True
     except Exception as e:
@@ -244,6 +279,7 @@ def send_email_verification_otp(user: User, otp: str) -> bool:
 
 class UserService:
     get_user_by_email = staticmethod(get_user_by_email)
+    get_user_identity_by_email = staticmethod(get_user_identity_by_email)
     create_user = staticmethod(create_user)
     update_user = staticmethod(update_user)
 
@@ -281,3 +317,4 @@ class EmailService:
 class OTPService:
     generate_otp = staticmethod(generate_otp)
     verify_otp = staticmethod(verify_otp)
+    verify_and_consume_otp = staticmethod(verify_and_consume_otp)
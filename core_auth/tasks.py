@@ -5,14 +5,89 @@ All email sending operations are handled asynchronously through Celery.
 """
 
 import logging
+from contextlib import suppress
+from datetime import timedelta
+from smtplib import SMTPServerDisconnected
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
+from django.core.signals import setting_changed
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
 from celery import shared_task
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from .models import OTPToken
 
 logger = logging.getLogger(__name__)
 
+_PASSWORD_RESET_OTP_MESSAGE = """Hello {name},
+
+Your OTP code is: {otp}
+
+This code will expire in {minutes} minutes.
+
+If you did not request this, please ignore this email.
+"""
+
+_EMAIL_VERIFICATION_OTP_MESSAGE = """Hello {name},
+
+Your verification OTP is: {otp}
+
+This code will expire in {minutes} minutes.
+"""
+
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def _otp_expiry_minutes():
+    return getattr(settings, "AUTH_FEATURES", {}).get("OTP_EXPIRY_MINUTES", 10)
+
+
+# This worker process's mail connection, kept open between tasks
+_connection = None
+
+
+def _mail_connection():
+    global _connection
+    if _connection is None:
+        _connection = get_connection()
+        _connection.open()
+    return _connection
+
+
+def _drop_mail_connection():
+    global _connection
+    if _connection is not None:
+        with suppress(Exception):
+            _connection.close()
+        _connection = None
+
+
+@receiver(setting_changed)
+def _reset_mail_connection(setting, **kwargs):
+    if setting.startswith("EMAIL_"):
+        _drop_mail_connection()
+
+
+def _send_message(email):
+    """
+    Send an EmailMessage over the worker's persistent connection, so
+    consecutive emails share one SMTP session. A session the server has
+    closed while idle is reopened once; any other failure drops it for
+    the retry.
+    """
+    try:
+        email.connection = _mail_connection()
+        return email.send()
+    except SMTPServerDisconnected:
+        _drop_mail_connection()
+        email.connection = _mail_connection()
+        return email.send()
+    except Exception:
+        _drop_mail_connection()
+        raise
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, rate_limit="30/s", acks_late=True)
 def send_password_reset_otp_email_task(self, user_email: str, user_full_name: str, otp: str):
     """
     Send password reset OTP email asynchronously.
@@ -23,23 +98,19 @@ def send_password_reset_otp_email_task(self, user_email: str, user_full_name: st
         otp: One-time password code
     """
     subject = "Password Reset OTP"
-    message = f"""Hello {user_full_name or user_email},
-
-Your OTP code is: {otp}
-
-This code will expire in {settings.AUTH_FEATURES.get('OTP_EXPIRY_MINUTES', 10)} minutes.
-
-If you did not request this, please ignore this email.
-"""
+    message = _PASSWORD_RESET_OTP_MESSAGE.format(
+        name=user_full_name or user_email,
+        otp=otp,
+        minutes=_otp_expiry_minutes(),
+    )
 
     try:
-        result = send_mail(
-            subject=subject,
-            message=message,
+        result = _send_message(EmailMessage(
+            subject,
+            message,
             from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user_email],
-            fail_silently=False,
-        )
+            to=[user_email],
+        ))
         logger.info(f"Password reset OTP email sent successfully to {user_email}")
         return result > 0
     except Exception as exc:
@@ -48,7 +119,7 @@ If you did not request this, please ignore this email.
         raise self.retry(exc=exc)
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, rate_limit="30/s", acks_late=True)
 def send_email_verification_otp_task(self, user_email: str, user_full_name: str, otp: str):
     """
     Send email verification OTP asynchronously.
@@ -59,21 +130,19 @@ def send_email_verification_otp_task(self, user_email: str, user_full_name: str,
         otp: One-time password code
     """
     subject = "Verify Your Email Address"
-    message = f"""Hello {user_full_name or user_email},
-
-Your verification OTP is: {otp}
-
-This code will expire in {settings.AUTH_FEATURES.get('OTP_EXPIRY_MINUTES', 10)} minutes.
-"""
+    message = _EMAIL_VERIFICATION_OTP_MESSAGE.format(
+        name=user_full_name or user_email,
+        otp=otp,
+        minutes=_otp_expiry_minutes(),
+    )
 
     try:
-        result = send_mail(
-            subject=subject,
-            message=message,
+        result = _send_message(EmailMessage(
+            subject,
+            message,
             from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user_email],
-            fail_silently=False,
-        )
+            to=[user_email],
+        ))
         logger.info(f"Email verification OTP sent successfully to {user_email}")
         return result > 0
     except Exception as exc:
@@ -82,7 +151,7 @@ This code will expire in {settings.AUTH_FEATURES.get('OTP_EXPIRY_MINUTES', 10)}
         raise self.retry(exc=exc)
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, rate_limit="100/s", acks_late=True)
 def send_generic_email_task(
     self,
     subject: str,
@@ -105,17 +174,59 @@ def send_generic_email_task(
         from_email = settings.DEFAULT_FROM_EMAIL
 
     try:
-        result = send_mail(
-            subject=subject,
-            message=message,
-            from_email=from_email,
-            recipient_list=recipient_list,
-            fail_silently=False,
-            html_message=html_message,
+        email = EmailMultiAlternatives(
+            subject, message, from_email=from_email, to=recipient_list
         )
+        if html_message:
+            email.attach_alternative(html_message, "text/html")
+        result = _send_message(email)
         logger.info(f"Generic email sent successfully to {recipient_list}")
         return result > 0
     except Exception as exc:
         logger.error(f"Failed to send generic email to {recipient_list}: {str(exc)}")
         # Retry the task if it fails
         raise self.retry(exc=exc)
+
+
+def _delete_in_batches(queryset, batch_size=10000):
+    """Delete the rows of `queryset` a batch at a time; returns the count."""
+    total = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return total
+        deleted, _ = queryset.model.objects.filter(pk__in=pks).delete()
+        total += deleted
+
+
+@shared_task
+def cleanup_expired_tokens():
+    """
+    Delete OTP tokens that are of no further use.
+
+    A token goes once it has been expired, or used, for over a day (the
+    margin keeps the recently used OTP that reset_password looks for).
+    Rows are deleted in batches so no single statement locks the table
+    for long.
+    """
+    cutoff = timezone.now() - timedelta(days=1)
+    stale = Q(expires_at__lt=cutoff) | Q(is_used=True, created_at__lt=cutoff)
+
+    deleted = _delete_in_batches(OTPToken.objects.filter(stale))
+    logger.info(f"Deleted {deleted} expired OTP tokens")
+    return deleted
+
+
+@shared_task
+def flush_expired_refresh_tokens():
+    """
+    Delete refresh tokens past their expiry from simplejwt's outstanding
+    list; their blacklist entries cascade with them. An expired token is
+    rejected on its signature claims alone, so the rows serve no purpose
+    and only grow the tables the refresh endpoint checks.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+
+    deleted = _delete_in_batches(expired)
+    logger.info(f"Deleted {deleted} expired refresh token rows")
+    return deleted
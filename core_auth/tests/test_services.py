@@ -34,6 +34,15 @@ class UserServiceTestCase(TestCase):
         found_user = UserService.get_user_by_email("nonexistent@example.com")
         self.assertIsNone(found_user)
 
+    def test_get_user_by_email_case_insensitive(self):
+        """Test that the lookup ignores the case of the address."""
+        user = User.objects.create_user(
+            email="TestUser@Example.com", password="SecurePass123!"
+        )
+        self.assertEqual(user.email, "testuser@example.com")
+        found_user = UserService.get_user_by_email("TESTUSER@example.COM")
+        self.assertEqual(found_user, user)
+
     def test_create_user(self):
         """Test creating user via service."""
         user = UserService.create_user(
@@ -78,6 +87,13 @@ class AuthenticationServiceTestCase(TestCase):
         )
         self.assertEqual(user, self.user)
 
+    def test_authenticate_user_mixed_case_email(self):
+        """Test authentication with the email in a different case."""
+        user = AuthenticationService.authenticate_user(
+            email="TestUser@Example.com", password="SecurePass123!"
+        )
+        self.assertEqual(user, self.user)
+
     def test_authenticate_user_wrong_password(self):
         """Test authentication with wrong password."""
         user = AuthenticationService.authenticate_user(
@@ -128,6 +144,31 @@ class OTPServiceTestCase(TestCase):
         )
         self.assertFalse(result)
 
+    def test_otp_stored_hashed(self):
+        """Test that only the hash of the code is stored."""
+        otp_token = OTPService.generate_otp(
+            self.user, OTPToken.OTPPurpose.PASSWORD_RESET
+        )
+        stored = OTPToken.objects.get(pk=otp_token.pk)
+        self.assertNotEqual(stored.token_hash, otp_token.token)
+        self.assertEqual(stored.token_hash, OTPToken.hash_token(otp_token.token))
+
+    def test_verify_otp_single_use(self):
+        """Test that a consumed OTP is rejected on second use."""
+        otp_token = OTPService.generate_otp(
+            self.user, OTPToken.OTPPurpose.EMAIL_VERIFICATION
+        )
+        purpose = OTPToken.OTPPurpose.EMAIL_VERIFICATION
+        self.assertTrue(OTPService.verify_otp(self.user, otp_token.token, purpose))
+        self.assertFalse(OTPService.verify_otp(self.user, otp_token.token, purpose))
+
+    def test_new_otp_replaces_previous(self):
+        """Test that issuing a new OTP invalidates the earlier one."""
+        purpose = OTPToken.OTPPurpose.PASSWORD_RESET
+        first = OTPService.generate_otp(self.user, purpose)
+        OTPService.generate_otp(self.user, purpose)
+        self.assertFalse(OTPService.verify_otp(self.user, first.token, purpose))
+
 
 class PasswordServiceTestCase(TestCase):
     """Test cases for PasswordService."""
@@ -143,3 +184,56 @@ class PasswordServiceTestCase(TestCase):
         self.assertTrue(result)
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password("NewPassword123!"))
+
+
+class PasswordResetServiceTestCase(TestCase):
+    """Test cases for PasswordResetService."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="OldPassword123!"
+        )
+        self.otp_token = OTPService.generate_otp(
+            self.user, OTPToken.OTPPurpose.PASSWORD_RESET
+        )
+
+    def test_verify_reset_otp_single_use(self):
+        """Test that a reset OTP is rejected on second use."""
+        self.assertTrue(
+            PasswordResetService.verify_reset_otp(
+                "testuser@example.com", self.otp_token.token
+            )
+        )
+        self.assertFalse(
+            PasswordResetService.verify_reset_otp(
+                "testuser@example.com", self.otp_token.token
+            )
+        )
+
+    def test_verify_reset_otp_mixed_case_email(self):
+        """Test that the reset OTP is found whatever the email's case."""
+        self.assertTrue(
+            PasswordResetService.verify_reset_otp(
+                "TestUser@Example.com", self.otp_token.token
+            )
+        )
+
+    def test_reset_password_requires_verified_otp(self):
+        """Test that a reset without a verified OTP is refused."""
+        self.assertFalse(
+            PasswordResetService.reset_password("testuser@example.com", "NewPassword123!")
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("OldPassword123!"))
+
+    def test_reset_password_single_use(self):
+        """Test that one verified OTP authorizes only one reset."""
+        PasswordResetService.verify_reset_otp("testuser@example.com", self.otp_token.token)
+        self.assertTrue(
+            PasswordResetService.reset_password("testuser@example.com", "NewPassword123!")
+        )
+        self.assertFalse(
+            PasswordResetService.reset_password("testuser@example.com", "OtherPassword123!")
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("NewPassword123!"))
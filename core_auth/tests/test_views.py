@@ -55,6 +55,20 @@ class RegistrationTestCase(TestCase):
         response = self.client.post(self.register_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_registration_duplicate_email_different_case(self):
+        """Test registration with an existing email in a different case."""
+        User.objects.create_user(
+            email="existing@example.com", password="ExistingPass123!"
+        )
+        data = {
+            "email": "Existing@Example.com",
+            "password": "SecurePass123!",
+            "confirm_password": "SecurePass123!",
+        }
+        response = self.client.post(self.register_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(User.objects.count(), 1)
+
 
 class LoginTestCase(TestCase):
     """Test cases for user login."""
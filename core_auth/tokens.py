@@ -4,6 +4,7 @@ Custom token utilities for the core_auth app.
 This module provides utilities for JWT token customization and management.
 """
 
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
 
@@ -57,7 +58,7 @@ def blacklist_token(refresh_token):
         token = RefreshToken(refresh_token)
         token.blacklist()
         return True
-    except Exception:
+    except TokenError:
         return False
 
 
@@ -74,7 +75,7 @@ def verify_token(token):
     try:
         RefreshToken(token)
         return True
-    except Exception:
+    except TokenError:
         return False
 
 
@@ -4,7 +4,7 @@ URL configuration for the core_auth app.
 This module defines all URL patterns for authentication endpoints.
 """
 
-from django.urls import path
+from django.urls import include, path
 from rest_framework_simplejwt.views import TokenVerifyView
 
 from .views import (
@@ -35,22 +35,30 @@ urlpatterns = [
     # =========================================================================
     # FORGOT PASSWORD ENDPOINTS (3-step process)
     # =========================================================================
-    # Step 1: Request OTP (email only)
+    # Grouped under one prefix so other paths are rejected with a single match
     path(
-        "forgot-password/request/",
-        ForgotPasswordRequestView.as_view(),
-        name="forgot_password_request",
-    ),
-    # Step 2: Verify OTP (email + OTP)
-    path(
-        "forgot-password/verify-otp/",
-        ForgotPasswordVerifyOTPView.as_view(),
-        name="forgot_password_verify_otp",
-    ),
-    # Step 3: Reset password (email + OTP + new password)
-    path(
-        "forgot-password/reset/",
-        ForgotPasswordResetView.as_view(),
-        name="forgot_password_reset",
+        "forgot-password/",
+        include(
+            [
+                # Step 1: Request OTP (email only)
+                path(
+                    "request/",
+                    ForgotPasswordRequestView.as_view(),
+                    name="forgot_password_request",
+                ),
+                # Step 2: Verify OTP (email + OTP)
+                path(
+                    "verify-otp/",
+                    ForgotPasswordVerifyOTPView.as_view(),
+                    name="forgot_password_verify_otp",
+                ),
+                # Step 3: Reset password (email + OTP + new password)
+                path(
+                    "reset/",
+                    ForgotPasswordResetView.as_view(),
+                    name="forgot_password_reset",
+                ),
+            ]
+        ),
     ),
 ]
@@ -7,12 +7,14 @@ user registration, profile management, and password operations.
 Views are kept thin by delegating business logic to service classes.
 """
 
-import threading
+import logging
+
 from .models import OTPToken, User
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenRefreshView
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample
@@ -42,6 +44,7 @@ from .services import (
 )
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 class RegisterView(generics.CreateAPIView):
@@ -96,9 +99,8 @@ class RegisterView(generics.CreateAPIView):
         try:
             EmailVerificationService.send_verification_email(user)
             message = "Registration successful. Please check your email for verification OTP."
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to send verification email: {e}")
+        except Exception:
+            logger.exception("Failed to send verification email")
             message = "Registration successful, but we couldn't send the verification email. Please try again later."
 
         return Response(
@@ -120,6 +122,10 @@ class LoginView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    # Checked before the password hasher runs, so floods are turned away
+    # without paying for a hash each
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "login"
     
     @extend_schema(
         summary="Login user",
@@ -142,7 +148,8 @@ class LoginView(APIView):
                 }
             ),
             400: "Bad Request - Invalid credentials",
-            401: "Unauthorized - Invalid credentials"
+            401: "Unauthorized - Invalid credentials",
+            429: "Too Many Requests - Login attempts throttled"
         },
         tags=['Authentication']
     )
@@ -313,9 +320,8 @@ class ForgotPasswordRequestView(APIView):
                     },
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to send password reset OTP: {e}")
+        except Exception:
+            logger.exception("Failed to send password reset OTP")
             return Response(
                 {
                     "error": "Failed to send password reset OTP. Please try again later."
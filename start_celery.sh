@@ -36,7 +36,7 @@ echo "  python manage.py runserver"
 echo ""
 echo "Terminal 2 - Celery Worker:"
 echo "  source myenv/bin/activate"
-echo "  celery -A EduTutor worker --loglevel=info --pool=solo"
+echo "  celery -A EduTutor worker --loglevel=info --pool=solo -Q celery,email_queue"
 echo ""
 echo "Terminal 3 - Celery Beat (optional):"
 echo "  source myenv/bin/activate"
@@ -6,12 +6,15 @@ from .models import PrivacyPolicy, TermsAndConditions
 @admin.register(PrivacyPolicy)
 class PrivacyPolicyAdmin(admin.ModelAdmin):
     list_display = ('id', 'effective_date')
-    search_fields = ('effective_date',)
-    ordering = ('-effective_date',)
+    list_filter = ('effective_date',)
+    # effective_date is set on insert, so newest-first is primary key order
+    ordering = ('-pk',)
+    show_full_result_count = False
 
 
 @admin.register(TermsAndConditions)
 class TermsAndConditionsAdmin(admin.ModelAdmin):
     list_display = ('id', 'effective_date')
-    search_fields = ('effective_date',)
-    ordering = ('-effective_date',)
\ No newline at end of file
+    list_filter = ('effective_date',)
+    ordering = ('-pk',)
+    show_full_result_count = False
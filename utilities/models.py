@@ -1,4 +1,8 @@
-from django.db import models
+from functools import partial
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 
 # Create your models here.
 
@@ -15,4 +19,22 @@ class TermsAndConditions(models.Model):
     effective_date = models.DateField(auto_now_add=True)
 
     def __str__(self):
-        return f"TermsAndConditions effective from {self.effective_date}"
\ No newline at end of file
+        return f"TermsAndConditions effective from {self.effective_date}"
+
+
+def latest_cache_key(model):
+    """Cache key of the serialized latest document of `model`."""
+    return f"utilities:{model._meta.model_name}:latest"
+
+
+def _forget_latest(sender, **kwargs):
+    """
+    Any write to a document may change which one, or what, is latest.
+    Deleted on commit, so a concurrent read can't re-cache the old one.
+    """
+    transaction.on_commit(partial(cache.delete, latest_cache_key(sender)))
+
+
+for _sender in (PrivacyPolicy, TermsAndConditions):
+    post_save.connect(_forget_latest, sender=_sender)
+    post_delete.connect(_forget_latest, sender=_sender)
@@ -1,12 +1,45 @@
+from django.conf import settings
 from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .models import PrivacyPolicy, TermsAndConditions
+from django.core.cache import cache
+from .models import PrivacyPolicy, TermsAndConditions, latest_cache_key
 from .serializers import PrivacyPolicySerializer, TermsAndConditionsSerializer
 from drf_spectacular.utils import extend_schema, OpenApiResponse, extend_schema_view
 
 
+# Writes clear the cached copy (see models.py); the timeout is a backstop
+LATEST_CACHE_TIMEOUT = 3600
+
+
+def latest_document(model):
+    """
+    Latest document of `model`, or None. effective_date is set on insert
+    and never changes, so the newest row is the latest one; ordering by
+    pk walks the primary key index instead of sorting on the date.
+    """
+    return model.objects.order_by('-pk').first()
+
+
+def latest_document_data(model, serializer_class):
+    """
+    Serialized latest document of `model`, from the cache when possible
+    (with settings.SHARED_CACHE), or None if there is none.
+    """
+    if not settings.SHARED_CACHE:
+        document = latest_document(model)
+        return None if document is None else serializer_class(document).data
+    key = latest_cache_key(model)
+    data = cache.get(key)
+    if data is None:
+        document = latest_document(model)
+        if document is None:
+            return None
+        data = dict(serializer_class(document).data)
+        cache.set(key, data, LATEST_CACHE_TIMEOUT)
+    return data
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -46,15 +79,13 @@ class PrivacyPolicyView(APIView):
     """
 
     def get(self, request, *args, **kwargs):
-        try:
-            policy = PrivacyPolicy.objects.latest('effective_date')
-            serializer = PrivacyPolicySerializer(policy)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except PrivacyPolicy.DoesNotExist:
+        data = latest_document_data(PrivacyPolicy, PrivacyPolicySerializer)
+        if data is None:
             return Response(
                 {"detail": "Privacy Policy not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request, *args, **kwargs):
         serializer = PrivacyPolicySerializer(data=request.data)
@@ -64,18 +95,17 @@ class PrivacyPolicyView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def patch(self, request, *args, **kwargs):
-        try:
-            policy = PrivacyPolicy.objects.latest('effective_date')
-            serializer = PrivacyPolicySerializer(policy, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except PrivacyPolicy.DoesNotExist:
+        policy = latest_document(PrivacyPolicy)
+        if policy is None:
             return Response(
                 {"detail": "Privacy Policy not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        serializer = PrivacyPolicySerializer(policy, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
  
 @extend_schema_view(
@@ -118,15 +148,13 @@ class TermsAndConditionsView(APIView):
 
 
     def get(self, request, *args, **kwargs):
-        try:
-            terms = TermsAndConditions.objects.latest('effective_date')
-            serializer = TermsAndConditionsSerializer(terms)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except TermsAndConditions.DoesNotExist:
+        data = latest_document_data(TermsAndConditions, TermsAndConditionsSerializer)
+        if data is None:
             return Response(
                 {"detail": "Terms and Conditions not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        return Response(data, status=status.HTTP_200_OK)
 
     
     def post(self, request, *args, **kwargs):
@@ -137,15 +165,14 @@ class TermsAndConditionsView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def patch(self, request, *args, **kwargs):
-        try:
-            terms = TermsAndConditions.objects.latest('effective_date')
-            serializer = TermsAndConditionsSerializer(terms, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except TermsAndConditions.DoesNotExist:
+        terms = latest_document(TermsAndConditions)
+        if terms is None:
             return Response(
                 {"detail": "Terms and Conditions not found."},
                 status=status.HTTP_404_NOT_FOUND,
-            )
\ No newline at end of file
+            )
+        serializer = TermsAndConditionsSerializer(terms, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file